@@ -4,125 +4,35 @@ Bhashini QoS Dashboards - Full Stack Fly.io Deployment
 Flask app serving the public dashboard with links to Grafana
 """
 
-from flask import Flask, render_template_string, send_from_directory
+from flask import Flask, Response, redirect, request, send_from_directory
+from flask_compress import Compress
+import hashlib
 import os
 
 app = Flask(__name__)
 
+# Transparent br/gzip compression for the HTML/CSS/JSON payloads
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'application/json']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
+# Stylesheet is served from /static with a content hash so browsers can cache it indefinitely
+with open(os.path.join(app.static_folder, 'dashboard.css'), 'rb') as css_file:
+    CSS_VERSION = hashlib.md5(css_file.read()).hexdigest()[:12]
+
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
 # HTML template for the dashboard
-DASHBOARD_HTML = """
+DASHBOARD_HTML = f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Bhashini QoS Dashboards - Full Stack Monitoring</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            min-height: 100vh;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 40px;
-        }
-        .header h1 {
-            font-size: 3rem;
-            margin: 0;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        .header p {
-            font-size: 1.2rem;
-            opacity: 0.9;
-        }
-        .dashboard-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 20px;
-            margin-top: 40px;
-        }
-        .dashboard-card {
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border-radius: 15px;
-            padding: 25px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }
-        .dashboard-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        }
-        .dashboard-card h3 {
-            margin: 0 0 15px 0;
-            color: #fff;
-            font-size: 1.5rem;
-        }
-        .dashboard-card p {
-            margin: 0 0 20px 0;
-            opacity: 0.9;
-            line-height: 1.6;
-        }
-        .dashboard-card a {
-            display: inline-block;
-            background: linear-gradient(45deg, #ff6b6b, #ee5a24);
-            color: white;
-            text-decoration: none;
-            padding: 12px 24px;
-            border-radius: 25px;
-            font-weight: bold;
-            transition: all 0.3s ease;
-        }
-        .dashboard-card a:hover {
-            transform: scale(1.05);
-            box-shadow: 0 5px 15px rgba(0,0,0,0.3);
-        }
-        .status {
-            text-align: center;
-            margin: 20px 0;
-            padding: 15px;
-            background: rgba(76, 175, 80, 0.2);
-            border-radius: 10px;
-            border: 1px solid rgba(76, 175, 80, 0.3);
-        }
-        .status h3 {
-            margin: 0;
-            color: #4caf50;
-        }
-        .service-links {
-            text-align: center;
-            margin: 30px 0;
-            padding: 20px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-        }
-        .service-links h3 {
-            margin: 0 0 20px 0;
-            color: #fff;
-        }
-        .service-links a {
-            display: inline-block;
-            margin: 10px;
-            padding: 10px 20px;
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-            text-decoration: none;
-            border-radius: 10px;
-            transition: all 0.3s ease;
-        }
-        .service-links a:hover {
-            background: rgba(255, 255, 255, 0.3);
-            transform: translateY(-2px);
-        }
-    </style>
+    <link rel="stylesheet" href="/static/dashboard.css?v={CSS_VERSION}">
 </head>
 <body>
     <div class="container">
@@ -196,29 +106,61 @@ DASHBOARD_HTML = """
 </html>
 """
 
+# Encode the static dashboard once at import time instead of on every request
+DASHBOARD_BYTES = DASHBOARD_HTML.encode('utf-8')
+DASHBOARD_ETAG = hashlib.md5(DASHBOARD_BYTES).hexdigest()
+
+CACHE_CONTROL = 'public, max-age=3600'
+
+
+def cached_html_response(body, etag):
+    """Serve a precomputed HTML body, answering 304 when the client's ETag matches"""
+    if request.if_none_match and etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 @app.route('/')
 def home():
-    return DASHBOARD_HTML
+    return cached_html_response(DASHBOARD_BYTES, DASHBOARD_ETAG)
+
+@app.after_request
+def cache_versioned_static(response):
+    """Mark versioned static assets as immutable"""
+    if request.path.startswith('/static/') and request.query_string:
+        response.headers['Cache-Control'] = STATIC_CACHE_CONTROL
+    return response
+
+HEALTH_BODY = b"OK - Full Stack Monitoring System Running"
+HEALTH_HEADERS = [
+    ('Content-Type', 'text/plain; charset=utf-8'),
+    ('Content-Length', str(len(HEALTH_BODY))),
+]
+
+
+def health_fast_path(wsgi_app):
+    """Answer /health at the WSGI layer, before Flask builds a request context"""
+    def middleware(environ, start_response):
+        if environ.get('PATH_INFO') == '/health':
+            start_response('200 OK', HEALTH_HEADERS)
+            return [HEALTH_BODY]
+        return wsgi_app(environ, start_response)
+    return middleware
 
-@app.route('/health')
-def health():
-    return "OK - Full Stack Monitoring System Running"
+app.wsgi_app = health_fast_path(app.wsgi_app)
 
 @app.route('/grafana')
 def grafana_redirect():
-    return """
-    <html>
-    <head>
-        <title>Redirecting to Grafana...</title>
-        <meta http-equiv="refresh" content="0; url=/grafana/">
-    </head>
-    <body>
-        <p>Redirecting to Grafana...</p>
-        <script>window.location.href = '/grafana/';</script>
-    </body>
-    </html>
-    """
+    response = redirect('/grafana/', code=308)
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    return response
 
 if __name__ == '__main__':
+    # Local development only; production runs asgi:asgi_app under Uvicorn
     port = int(os.environ.get('PORT', 80))
     app.run(host='0.0.0.0', port=port, debug=False)
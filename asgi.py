@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+ASGI entrypoint for the Bhashini QoS dashboard app
+Wraps the Flask WSGI app so it can be served by Uvicorn
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
@@ -3,12 +3,12 @@
 Simple QoS data generator for Bhashini Dashboards
 """
 
+import asyncio
 import os
 import time
-import random
-from datetime import datetime, timedelta
-from influxdb_client import InfluxDBClient, Point
-from influxdb_client.client.write_api import SYNCHRONOUS
+import numpy as np
+from influxdb_client import WritePrecision
+from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
 
 # Configuration
 INFLUXDB_URL = os.getenv('INFLUXDB_URL', 'http://localhost:8086')
@@ -16,93 +16,96 @@ INFLUXDB_TOKEN = os.getenv('INFLUXDB_TOKEN', 'admin-token-123')
 INFLUXDB_ORG = os.getenv('INFLUXDB_ORG', 'bhashini')
 INFLUXDB_BUCKET = os.getenv('INFLUXDB_BUCKET', 'qos_metrics')
 
-def generate_qos_data():
-    """Generate realistic QoS metrics data"""
+# Service configurations
+SERVICES = ['asr', 'translation', 'tts']
+TIER_BY_TENANT = {
+    'enterprise_1': 'premium',
+    'startup_1': 'standard',
+    'freemium_1': 'basic',
+}
+
+# (base_availability, base_latency, base_error_rate) per SLA tier; better for premium tiers
+BASE_PARAMS_BY_TIER = {
+    'premium': (99.5, 50, 0.1),
+    'standard': (97.0, 150, 0.5),
+    'basic': (94.0, 300, 1.0),
+}
+
+# Flattened (service, tenant, tier, base_availability, base_latency, base_error_rate) rows
+SERIES_PARAMS = [
+    (service, tenant, sla_tier, *BASE_PARAMS_BY_TIER[sla_tier])
+    for service in SERVICES
+    for tenant, sla_tier in TIER_BY_TENANT.items()
+]
+
+GENERATION_INTERVAL = 30  # seconds between ticks
+
+# Single generator for all per-tick random draws
+rng = np.random.default_rng()
+
+async def tenant_loop(write_api, tenant):
+    """Generate and write realistic QoS metrics for one tenant's series"""
     
-    # Initialize InfluxDB client
-    client = InfluxDBClient(url=INFLUXDB_URL, token=INFLUXDB_TOKEN, org=INFLUXDB_ORG)
-    write_api = client.write_api(write_options=SYNCHRONOUS)
+    rows = [row for row in SERIES_PARAMS if row[1] == tenant]
     
-    # Service configurations
-    services = ['asr', 'translation', 'tts']
-    tenants = ['enterprise_1', 'startup_1', 'freemium_1']
-    sla_tiers = ['premium', 'standard', 'basic']
+    # Tag cardinality is fixed, so build the line-protocol prefixes once
+    series = [
+        f"qos_metrics,service_name={service},tenant_id={tenant},sla_tier={sla_tier} "
+        for service, _, sla_tier, _, _, _ in rows
+    ]
     
-    try:
-        while True:
-            timestamp = datetime.utcnow()
-            points = []
-            
-            for service in services:
-                for tenant in tenants:
-                    # Determine SLA tier based on tenant
-                    sla_tier = 'premium' if tenant == 'enterprise_1' else 'standard' if tenant == 'startup_1' else 'basic'
-                    
-                    # Generate availability (higher for premium tiers)
-                    base_availability = 99.5 if sla_tier == 'premium' else 97.0 if sla_tier == 'standard' else 94.0
-                    availability = max(85.0, min(100.0, base_availability + random.uniform(-2.0, 2.0)))
-                    
-                    # Generate latency (lower for premium tiers)
-                    base_latency = 50 if sla_tier == 'premium' else 150 if sla_tier == 'standard' else 300
-                    latency = max(10, min(1000, base_latency + random.uniform(-20, 50)))
-                    
-                    # Generate error rate (lower for premium tiers)
-                    base_error_rate = 0.1 if sla_tier == 'premium' else 0.5 if sla_tier == 'standard' else 1.0
-                    error_rate = max(0.0, min(5.0, base_error_rate + random.uniform(-0.1, 0.3)))
-                    
-                    # Generate throughput
-                    throughput = random.uniform(100, 2000)
-                    
-                    # Create data points
-                    points.extend([
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "availability")
-                            .field("value", availability)
-                            .time(timestamp),
-                        
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "latency")
-                            .field("value", latency)
-                            .time(timestamp),
-                        
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "error_rate")
-                            .field("value", error_rate)
-                            .time(timestamp),
-                        
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "throughput")
-                            .field("value", throughput)
-                            .time(timestamp)
-                    ])
-            
-            # Write data to InfluxDB
-            if points:
-                write_api.write(bucket=INFLUXDB_BUCKET, record=points)
-                print(f"✅ Generated {len(points)} data points at {timestamp}")
-            
-            # Wait before next generation
-            time.sleep(30)  # Generate data every 30 seconds
-            
-    except KeyboardInterrupt:
-        print("\n🛑 Data generation stopped by user")
-    except Exception as e:
-        print(f"❌ Error generating data: {e}")
-    finally:
-        client.close()
+    _, _, _, base_availability, base_latency, base_error_rate = zip(*rows)
+    base_availability = np.array(base_availability, dtype=float)
+    base_latency = np.array(base_latency, dtype=float)
+    base_error_rate = np.array(base_error_rate, dtype=float)
+    n_series = len(series)
+    
+    while True:
+        # One nanosecond timestamp shared by every line in this tick
+        ts_ns = time.time_ns()
+        
+        # Generate all series' values in one vectorized draw per metric
+        availability = np.clip(base_availability + rng.uniform(-2.0, 2.0, n_series), 85.0, 100.0)
+        latency = np.clip(base_latency + rng.uniform(-20, 50, n_series), 10, 1000)
+        error_rate = np.clip(base_error_rate + rng.uniform(-0.1, 0.3, n_series), 0.0, 5.0)
+        throughput = rng.uniform(100, 2000, n_series)
+        
+        # Format only the numeric fields and timestamp per tick; one line carries all four metrics
+        lines = [
+            f"{prefix}availability={av},latency={lat},error_rate={err},throughput={tp} {ts_ns}"
+            for prefix, av, lat, err, tp in zip(
+                series, availability.tolist(), latency.tolist(), error_rate.tolist(), throughput.tolist()
+            )
+        ]
+        
+        try:
+            await write_api.write(bucket=INFLUXDB_BUCKET, record="\n".join(lines), write_precision=WritePrecision.NS)
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(ts_ns // 1_000_000_000))
+            print(f"✅ Generated {len(lines)} data points for {tenant} at {timestamp}")
+        except Exception as e:
+            print(f"❌ Error writing data for {tenant}: {e}")
+        
+        # Wait before next generation
+        await asyncio.sleep(GENERATION_INTERVAL)
+
+async def generate_qos_data():
+    """Generate realistic QoS metrics data, one concurrent loop per tenant"""
+    
+    # One keep-alive client shared by every tenant loop; line protocol is gzipped on the wire
+    async with InfluxDBClientAsync(url=INFLUXDB_URL, token=INFLUXDB_TOKEN, org=INFLUXDB_ORG, enable_gzip=True) as client:
+        write_api = client.write_api()
+        tasks = [asyncio.create_task(tenant_loop(write_api, tenant)) for tenant in TIER_BY_TENANT]
+        await asyncio.gather(*tasks)
 
 if __name__ == "__main__":
     print("🚀 Starting QoS data generation...")
-    generate_qos_data()
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    try:
+        asyncio.run(generate_qos_data())
+    except KeyboardInterrupt:
+        print("\n🛑 Data generation stopped by user")
@@ -13,10 +13,11 @@ mkdir -p aws-deployment/grafana/provisioning/alerting
 mkdir -p aws-deployment/public-dashboard
 mkdir -p aws-deployment/data-generator
 
-# Copy Grafana provisioning files
-echo "📁 Copying Grafana provisioning files..."
-cp -r grafana/provisioning/dashboards/* aws-deployment/grafana/provisioning/dashboards/
-cp -r grafana/provisioning/alerting/* aws-deployment/grafana/provisioning/alerting/
+# Grafana provisioning is maintained in aws-deployment/grafana itself: its dashboards and alert
+# rules query the multi-field qos_metrics schema (one field per metric), while the root
+# grafana/ tree still targets the metric_type/value points of the local simulator, so it must
+# not be copied over them.
+echo "📁 Using aws-deployment Grafana provisioning files..."
 
 # Copy public dashboard files
 echo "🌐 Copying public dashboard files..."
@@ -84,40 +85,18 @@ def generate_qos_data():
                     # Generate throughput
                     throughput = random.uniform(100, 2000)
                     
-                    # Create data points
-                    points.extend([
+                    # One point per series carries all four metrics as fields
+                    points.append(
                         Point("qos_metrics")
                             .tag("service_name", service)
                             .tag("tenant_id", tenant)
                             .tag("sla_tier", sla_tier)
-                            .field("metric_type", "availability")
-                            .field("value", availability)
-                            .time(timestamp),
-                        
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "latency")
-                            .field("value", latency)
-                            .time(timestamp),
-                        
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "error_rate")
-                            .field("value", error_rate)
-                            .time(timestamp),
-                        
-                        Point("qos_metrics")
-                            .tag("service_name", service)
-                            .tag("tenant_id", tenant)
-                            .tag("sla_tier", sla_tier)
-                            .field("metric_type", "throughput")
-                            .field("value", throughput)
+                            .field("availability", availability)
+                            .field("latency", latency)
+                            .field("error_rate", error_rate)
+                            .field("throughput", throughput)
                             .time(timestamp)
-                    ])
+                    )
             
             # Write data to InfluxDB
             if points:
@@ -1,12 +1,318 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import APIRouter, FastAPI, HTTPException, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import hashlib
+import hmac
+import ipaddress
 import logging
+import orjson
+import os
+import time
+
+from customer_profiler import CustomerProfiler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Bhashini BI API", version="1.0.0")
+def _prebuilt_deny(status: int, detail: str, *extra_headers) -> Tuple[dict, dict]:
+    """Serialize a rejection once at import so deny paths send it without allocating"""
+    body = orjson.dumps({"detail": detail})
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *extra_headers,
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+class EdgeMiddleware:
+    """Single pure-ASGI layer for host, CORS, bearer-auth and token-bucket rate-limit checks
+    
+    The request headers are scanned once and every check runs before the app is
+    entered, instead of stacking one middleware wrapper per concern.
+    """
+    
+    UNAUTHORIZED = _prebuilt_deny(401, "Not authenticated", (b"www-authenticate", b"Bearer"))
+    RATE_LIMITED = _prebuilt_deny(429, "Rate limit exceeded", (b"retry-after", b"60"))
+    INVALID_HOST = _prebuilt_deny(400, "Invalid host header")
+    
+    def __init__(self, app, rate: Optional[float] = None, capacity: int = 0,
+                 buckets: "Optional[OrderedDict[str, Tuple[float, float]]]" = None,
+                 max_clients: int = 100_000, require_auth: bool = False,
+                 exempt_paths=("/", "/health"), allowed_hosts=None, allowed_origins=None,
+                 trusted_proxies=None, api_tokens=None):
+        self.app = app
+        # None disables rate limiting
+        self.rate = rate  # tokens refilled per second
+        self.capacity = capacity
+        # client -> (tokens, last_refill), least recently seen first
+        self.buckets = buckets if buckets is not None else OrderedDict()
+        self.max_clients = max_clients
+        # Bearer tokens are checked against these shared secrets; without any, no request is authenticated
+        self.api_tokens = tuple(t.encode() for t in api_tokens or ())
+        if require_auth and not self.api_tokens:
+            raise ValueError("require_auth needs at least one API token (BI_API_TOKENS)")
+        self.require_auth = require_auth
+        self.exempt_paths = frozenset(exempt_paths)
+        # None accepts any Host header / emits no CORS headers
+        self.allowed_hosts = frozenset(h.encode() for h in allowed_hosts) if allowed_hosts else None
+        self.allowed_origins = frozenset(o.encode() for o in allowed_origins) if allowed_origins else None
+        # Proxy addresses/networks whose X-Forwarded-For is believed; the client is the first
+        # untrusted hop from the right, so spoofed entries a client prepends are ignored
+        self.trusted_proxies = tuple(ipaddress.ip_network(p, strict=False) for p in trusted_proxies or ())
+    
+    def _is_trusted_proxy(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+    
+    def _token_valid(self, token: bytes) -> bool:
+        """Constant-time comparison against every configured token"""
+        valid = False
+        for expected in self.api_tokens:
+            valid |= hmac.compare_digest(token, expected)
+        return valid
+    
+    def _client_key(self, scope, forwarded_for: bytes) -> str:
+        """Rate-limit key: the peer address, or the forwarded client when the peer is a trusted proxy"""
+        client = scope.get("client")
+        address = client[0] if client else "unknown"
+        if not forwarded_for or not self.trusted_proxies or not self._is_trusted_proxy(address):
+            return address
+        hops = [hop.strip() for hop in forwarded_for.decode("latin-1").split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not self._is_trusted_proxy(hop):
+                return hop
+        return hops[0] if hops else address
+    
+    @staticmethod
+    async def _reject(send, deny: Tuple[dict, dict], cors_headers=()):
+        start, body = deny
+        if cors_headers:
+            # Copy rather than mutate the shared prebuilt message
+            start = {**start, "headers": [*start["headers"], *cors_headers]}
+        await send(start)
+        await send(body)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # One pass over the raw header list for everything the checks below need
+        host = origin = authorization = forwarded_for = b""
+        for name, value in scope["headers"]:
+            if name == b"host":
+                host = value
+            elif name == b"origin":
+                origin = value
+            elif name == b"authorization":
+                authorization = value
+            elif name == b"x-forwarded-for":
+                forwarded_for = forwarded_for + b"," + value if forwarded_for else value
+        
+        # Trusted host
+        if self.allowed_hosts is not None and host.split(b":", 1)[0] not in self.allowed_hosts:
+            await self._reject(send, self.INVALID_HOST)
+            return
+        
+        # CORS, answering preflight requests directly
+        cors_headers = ()
+        if origin and self.allowed_origins is not None and (
+                origin in self.allowed_origins or b"*" in self.allowed_origins):
+            cors_headers = ((b"access-control-allow-origin", origin), (b"vary", b"Origin"))
+            if scope["method"] == "OPTIONS":
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        *cors_headers,
+                        (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+                        (b"access-control-allow-headers", b"authorization, content-type"),
+                        (b"access-control-max-age", b"600"),
+                        (b"content-length", b"0"),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+        
+        # Bearer auth
+        token = authorization[7:].strip() if authorization[:7].lower() == b"bearer " else b""
+        if token and self._token_valid(token):
+            # Identify the caller by a digest so no part of the secret reaches request state or logs
+            scope.setdefault("state", {})["user_id"] = f"user_{hashlib.sha256(token).hexdigest()[:8]}"
+        elif self.require_auth and scope["path"] not in self.exempt_paths:
+            await self._reject(send, self.UNAUTHORIZED, cors_headers)
+            return
+        
+        # Token-bucket rate limit (opt-in; health checks and other exempt paths are never limited)
+        if self.rate is not None and scope["path"] not in self.exempt_paths:
+            key = self._client_key(scope, forwarded_for)
+            now = time.monotonic()
+            buckets = self.buckets
+            tokens, last_refill = buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + self.rate * (now - last_refill)) - 1
+            buckets[key] = (max(tokens, 0.0), now)
+            buckets.move_to_end(key)
+            if len(buckets) > self.max_clients:
+                buckets.popitem(last=False)
+            if tokens < 0:
+                await self._reject(send, self.RATE_LIMITED, cors_headers)
+                return
+        
+        if not cors_headers:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+def _env_list(name: str):
+    """Parse a comma-separated environment variable (None when unset or empty)"""
+    items = [item.strip() for item in os.getenv(name, "").split(",")]
+    return [item for item in items if item] or None
+
+# ISO timestamp shared by responses, refreshed once a second instead of formatted per request
+_cached_timestamp = datetime.utcnow().isoformat()
+
+async def _refresh_timestamp():
+    global _cached_timestamp
+    while True:
+        _cached_timestamp = datetime.utcnow().isoformat()
+        await asyncio.sleep(1)
+
+# Token buckets per client address, bounded by the middleware and swept for idle clients
+rate_limit_buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+BUCKET_IDLE_SECONDS = 600
+
+async def _sweep_rate_limit_buckets():
+    while True:
+        await asyncio.sleep(60)
+        cutoff = time.monotonic() - BUCKET_IDLE_SECONDS
+        # Buckets are kept in last-seen order, so idle ones are all at the front
+        while rate_limit_buckets:
+            key, (_, last_refill) = next(iter(rate_limit_buckets.items()))
+            if last_refill > cutoff:
+                break
+            del rate_limit_buckets[key]
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One warm profiler per worker; the config read and parse stay off the event loop
+    app.state.profiler = await run_in_threadpool(CustomerProfiler)
+    tasks = [
+        asyncio.create_task(_refresh_timestamp()),
+        asyncio.create_task(_sweep_rate_limit_buckets()),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+
+app = FastAPI(
+    title="Bhashini BI API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Compress larger JSON payloads; added first so the edge checks below run outside it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Rate limiting is opt-in like the other edge checks: BI_API_RATE_LIMIT_PER_MINUTE requests per
+# minute per client, with bursts of the same size. Behind a reverse proxy, list its addresses or
+# networks in BI_API_TRUSTED_PROXIES so clients are keyed by X-Forwarded-For, not the proxy IP.
+RATE_LIMIT_PER_MINUTE = int(os.getenv("BI_API_RATE_LIMIT_PER_MINUTE", "0"))
+
+app.add_middleware(
+    EdgeMiddleware,
+    rate=RATE_LIMIT_PER_MINUTE / 60 if RATE_LIMIT_PER_MINUTE > 0 else None,
+    capacity=RATE_LIMIT_PER_MINUTE,
+    buckets=rate_limit_buckets,
+    trusted_proxies=_env_list("BI_API_TRUSTED_PROXIES"),
+    require_auth=os.getenv("BI_API_REQUIRE_AUTH", "false").lower() == "true",
+    api_tokens=_env_list("BI_API_TOKENS"),
+    allowed_hosts=_env_list("BI_API_ALLOWED_HOSTS"),
+    allowed_origins=_env_list("BI_API_ALLOWED_ORIGINS"),
+)
+
+READ_CACHE_CONTROL = "private, max-age=30"
+# Distinguishes ETags across restarts and workers, whose profiler versions both start at 0
+ETAG_EPOCH = f"{os.getpid():x}.{time.time_ns():x}"
+
+def profiles_etag(profiler: CustomerProfiler) -> str:
+    """Weak ETag for profile reads, changing whenever any profile is created, updated or deactivated"""
+    return f'W/"{ETAG_EPOCH}.{profiler.version}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (``*`` or a list of ETags) against ``etag``"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+def conditional_response(request: Request, etag: str, content) -> Response:
+    """Answer with 304 when the client's ETag still matches, serializing the content only otherwise"""
+    headers = {"ETag": etag, "Cache-Control": READ_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=orjson.dumps(content), media_type="application/json", headers=headers)
+
+def stream_json_list(prefix: bytes, items: Iterable[Any], encode: Optional[Callable[[Any], Any]] = None,
+                     suffix: bytes = b"]}") -> StreamingResponse:
+    """Stream a JSON envelope around a list, serializing one item at a time
+    
+    ``prefix`` must end by opening the list (e.g. ``b'{"profiles":['``) and ``suffix``
+    closes it, so peak memory stays at one encoded item instead of the whole payload.
+    Items are passed to orjson as-is (dataclasses and datetimes included) unless
+    ``encode`` is given.
+    """
+    async def body():
+        yield prefix
+        first = True
+        for item in items:
+            chunk = orjson.dumps(item if encode is None else encode(item))
+            yield chunk if first else b"," + chunk
+            first = False
+        yield suffix
+    
+    return StreamingResponse(body(), media_type="application/json")
+
+# Per-tenant computed payloads: key -> (expires_at, serialized body), least recently used first
+RESULT_CACHE_TTL = 60
+RESULT_CACHE_MAX_ENTRIES = 10_000
+_result_cache: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+
+def cached_json(kind: str, tenant_id: str, build: Callable[[], Any]) -> Response:
+    """Serve a tenant's computed payload from the TTL cache, building and storing it on a miss"""
+    key = (kind, tenant_id)
+    now = time.monotonic()
+    entry = _result_cache.get(key)
+    if entry is None or entry[0] <= now:
+        entry = (now + RESULT_CACHE_TTL, orjson.dumps(build()))
+        _result_cache[key] = entry
+        # tenant_id comes from the path, so evict the least recently used entry to stay bounded
+        if len(_result_cache) > RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.popitem(last=False)
+    _result_cache.move_to_end(key)
+    return Response(content=entry[1], media_type="application/json")
 
 @app.get("/")
 async def root():
@@ -14,28 +320,68 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
+    return {"status": "healthy", "timestamp": _cached_timestamp}
+
+API_PREFIX = "/api/v1"
+router = APIRouter(prefix=API_PREFIX)
+
+def get_profiler(request: Request) -> CustomerProfiler:
+    return request.app.state.profiler
 
-@app.get("/profiles")
-async def get_profiles():
+@router.get("/profiles")
+async def get_profiles(profiler: CustomerProfiler = Depends(get_profiler)):
     """Get all customer profiles"""
-    return {"message": "Customer profiles endpoint", "status": "available"}
+    # Snapshot the views so concurrent updates cannot resize the dict or change a profile mid-stream
+    views = [profiler.get_profile_view(tenant_id) for tenant_id in list(profiler.profiles)]
+    return stream_json_list(b'{"profiles":[', views)
 
-@app.get("/profiles/{tenant_id}")
-async def get_profile(tenant_id: str):
+@router.get("/profiles/{tenant_id}")
+async def get_profile(tenant_id: str, request: Request, profiler: CustomerProfiler = Depends(get_profiler)):
     """Get customer profile by tenant ID"""
-    return {"message": f"Profile for tenant {tenant_id}", "status": "available"}
+    # Take the ETag before the view, so a concurrent update can only make it stale, never too new
+    etag = profiles_etag(profiler)
+    profile = profiler.get_profile_view(tenant_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found for tenant: {tenant_id}")
+    return conditional_response(request, etag, profile)
 
-@app.get("/value-estimation/{tenant_id}")
+@router.get("/analytics/sector/{sector}")
+async def get_sector_analytics(sector: str, request: Request, profiler: CustomerProfiler = Depends(get_profiler)):
+    """Get SLA tier and use case distributions and user totals for a sector's active profiles"""
+    # Read from the profiler's incrementally maintained aggregates; revalidates like profile reads
+    etag = profiles_etag(profiler)
+    return conditional_response(request, etag, {"sector": sector, **profiler.get_sector_metrics(sector)})
+
+@router.get("/value-estimation/{tenant_id}")
 async def get_value_estimation(tenant_id: str):
     """Get value estimation for tenant"""
-    return {"message": f"Value estimation for tenant {tenant_id}", "status": "available"}
+    return cached_json(
+        "value-estimation", tenant_id,
+        lambda: {"message": f"Value estimation for tenant {tenant_id}", "status": "available"},
+    )
 
-@app.get("/recommendations/{tenant_id}")
+@router.get("/recommendations/{tenant_id}")
 async def get_recommendations(tenant_id: str):
     """Get recommendations for tenant"""
-    return {"message": f"Recommendations for tenant {tenant_id}", "status": "available"}
+    return cached_json(
+        "recommendations", tenant_id,
+        lambda: {"message": f"Recommendations for tenant {tenant_id}", "status": "available"},
+    )
+
+app.include_router(router)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # BI_API_RELOAD=true enables the file watcher for local development only
+    reload = os.getenv("BI_API_RELOAD", "false").lower() == "true"
+    uvicorn.run(
+        "api_server:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="info",
+        reload=reload,
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
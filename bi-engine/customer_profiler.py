@@ -8,19 +8,112 @@ This module provides comprehensive customer profiling capabilities including:
 - Profile update mechanisms and historical tracking
 """
 
+import copy
+import functools
 import json
 import logging
+import os
+import re
+import sys
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-import yaml
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, fields
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: export falls back to the stdlib json path
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@functools.cache
+def _get_yaml_loader():
+    """Import PyYAML on first parse, preferring libyaml's C loader when it was built with it"""
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+# Sector keywords matched against whole words of an organization name, in priority order
+_SECTOR_KEYWORDS = (
+    ('government', frozenset({'ministry', 'ministries', 'department', 'departments', 'government',
+                              'govt', 'gov', 'public'})),
+    ('healthcare', frozenset({'hospital', 'hospitals', 'medical', 'health', 'healthcare', 'clinic',
+                              'clinics', 'pharma', 'pharmaceutical', 'pharmaceuticals', 'pharmacy'})),
+    ('education', frozenset({'university', 'universities', 'college', 'colleges', 'school', 'schools',
+                             'education', 'educational', 'academy'})),
+    ('NGO', frozenset({'foundation', 'trust', 'ngo', 'charity', 'charitable', 'social'})),
+)
+_NAME_TOKEN_SPLIT = re.compile(r'\W+')
+_SEARCH_TOKEN_RE = re.compile(r'\w+')
+
+# Profile validation rules
+_VALID_SECTORS = frozenset({'government', 'private', 'NGO', 'healthcare', 'education'})
+_VALID_USE_CASES = frozenset({
+    'citizen_services', 'healthcare', 'education', 'business_operations',
+    'community_services', 'content_localization', 'patient_communication'
+})
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Parsed YAML per path, reused while the file's mtime and size are unchanged
+_YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE: "OrderedDict[str, tuple]" = OrderedDict()  # path -> (mtime_ns, size, data)
+
+def _load_yaml_with_json_sidecar(path: Path, yaml_mtime_ns: int) -> Any:
+    """Parse a YAML file via a ``.json`` sidecar next to it, rebuilding the sidecar when stale
+    
+    JSON parses far faster than YAML, so the YAML parse is paid once per edit of the file.
+    """
+    sidecar = path.with_suffix('.json')
+    try:
+        if sidecar.stat().st_mtime_ns >= yaml_mtime_ns:
+            with open(sidecar, 'rb') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable sidecar: fall back to the YAML source
+    
+    import yaml
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_get_yaml_loader())
+    
+    # Write atomically so concurrent loaders never read a partial sidecar
+    tmp_path = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, sidecar)
+    except OSError as e:
+        logger.debug("Could not write JSON sidecar %s: %s", sidecar, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    return data
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, skipping the read and parse when it has not changed since the last load"""
+    key = str(path)
+    st = os.stat(key)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        # Hand out a copy so callers cannot mutate the cached document
+        return copy.deepcopy(cached[2])
+    
+    data = _load_yaml_with_json_sidecar(path, st.st_mtime_ns)
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+@dataclass(slots=True)
 class CustomerProfile:
     """Data model for customer profile information"""
     tenant_id: str
@@ -42,6 +135,52 @@ class CustomerProfile:
     industry: Optional[str] = None
     annual_revenue: Optional[float] = None
     employee_count: Optional[int] = None
+    
+    def to_view(self) -> 'CustomerProfileView':
+        """Immutable snapshot of this profile, with list fields frozen to tuples"""
+        return CustomerProfileView(*(
+            tuple(value) if type(value) is list else value
+            for value in (getattr(self, name) for name in _PROFILE_FIELD_NAMES)
+        ))
+
+@dataclass(slots=True, frozen=True)
+class CustomerProfileView:
+    """Read-only profile snapshot that API responses can share across requests without copying"""
+    tenant_id: str
+    organization_name: str
+    sector: str
+    use_case_category: str
+    specific_use_cases: Tuple[str, ...]
+    target_user_base: int
+    geographical_coverage: Tuple[str, ...]
+    languages_required: Tuple[str, ...]
+    business_goals: Tuple[str, ...]
+    success_metrics: Tuple[str, ...]
+    sla_tier: str
+    profile_created_date: datetime
+    last_updated: datetime
+    profile_status: str
+    contact_email: str
+    contact_phone: Optional[str] = None
+    industry: Optional[str] = None
+    annual_revenue: Optional[float] = None
+    employee_count: Optional[int] = None
+
+_PROFILE_FIELD_NAMES = tuple(f.name for f in fields(CustomerProfile))
+
+def _shallow_dict(profile: CustomerProfile) -> Dict[str, Any]:
+    """Field dict for a profile that shares its lists instead of deep-copying them like asdict()"""
+    return {name: getattr(profile, name) for name in _PROFILE_FIELD_NAMES}
+
+# Low-cardinality string fields shared across profiles via sys.intern
+_INTERNED_FIELDS = frozenset({'sector', 'use_case_category', 'sla_tier', 'profile_status'})
+
+def _intern(value: Any) -> Any:
+    """Intern a string so profiles share one object per distinct value"""
+    return sys.intern(value) if type(value) is str else value
+
+# Attribute names update_profile may assign; identity and creation date are fixed
+_UPDATABLE_FIELDS = frozenset(_PROFILE_FIELD_NAMES) - {'tenant_id', 'profile_created_date'}
 
 class CustomerProfiler:
     """Main customer profiling system"""
@@ -49,80 +188,147 @@ class CustomerProfiler:
     def __init__(self, tenant_config_path: str = "config/tenant-config.yml"):
         self.tenant_config_path = Path(tenant_config_path)
         self.profiles: Dict[str, CustomerProfile] = {}
+        # Bumped on every profile mutation; the API derives profile read ETags from it
+        self.version = 0
+        # Per-sector aggregates over non-inactive profiles, maintained as profiles change
+        self._sector_agg: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {'sla': Counter(), 'uc': Counter(), 'users': 0, 'count': 0}
+        )
+        # Secondary indexes over all profiles: field value -> tenant IDs
+        self._by_sector: Dict[str, set] = defaultdict(set)
+        self._by_use_case: Dict[str, set] = defaultdict(set)
+        self._by_sla: Dict[str, set] = defaultdict(set)
+        self._by_status: Dict[str, set] = defaultdict(set)
+        # Inverted search index: lowercased token -> tenant IDs, plus its sorted keys for prefix scans
+        self._token_index: Dict[str, set] = defaultdict(set)
+        self._sorted_tokens: List[str] = []
+        # Cached read-only views, dropped whenever the profile changes
+        self._views: Dict[str, CustomerProfileView] = {}
         self._load_existing_tenants()
     
+    @staticmethod
+    def _search_tokens(profile: CustomerProfile) -> set:
+        """Tokens a profile can be found by: words of its name plus its sector and use case"""
+        tokens = set(_SEARCH_TOKEN_RE.findall(profile.organization_name.lower()))
+        tokens.add(profile.sector.lower())
+        tokens.add(profile.use_case_category.lower())
+        return tokens
+    
+    def _track_profile(self, profile: CustomerProfile, sign: int):
+        """Add (sign=1) or remove (sign=-1) a profile from the secondary indexes and sector aggregates"""
+        tenant_id = profile.tenant_id
+        if sign < 0:
+            self._views.pop(tenant_id, None)
+        for index, key in ((self._by_sector, profile.sector),
+                           (self._by_use_case, profile.use_case_category),
+                           (self._by_sla, profile.sla_tier),
+                           (self._by_status, profile.profile_status)):
+            if sign > 0:
+                index[key].add(tenant_id)
+            else:
+                tenant_ids = index.get(key)
+                if tenant_ids is not None:
+                    tenant_ids.discard(tenant_id)
+                    if not tenant_ids:
+                        del index[key]
+        
+        for token in self._search_tokens(profile):
+            if sign > 0:
+                tenant_ids = self._token_index[token]
+                if not tenant_ids:
+                    insort(self._sorted_tokens, token)
+                tenant_ids.add(tenant_id)
+            else:
+                tenant_ids = self._token_index.get(token)
+                if tenant_ids is not None:
+                    tenant_ids.discard(tenant_id)
+                    if not tenant_ids:
+                        del self._token_index[token]
+                        del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+        
+        if profile.profile_status == 'inactive':
+            return
+        agg = self._sector_agg[profile.sector]
+        agg['sla'][profile.sla_tier] += sign
+        agg['uc'][profile.use_case_category] += sign
+        agg['users'] += sign * profile.target_user_base
+        agg['count'] += sign
+    
+    def _store_profile(self, profile: CustomerProfile):
+        """Store a profile, replacing any existing one for the same tenant"""
+        existing = self.profiles.get(profile.tenant_id)
+        if existing is not None:
+            self._track_profile(existing, -1)
+        self.profiles[profile.tenant_id] = profile
+        self._track_profile(profile, 1)
+        self.version += 1
+    
     def _load_existing_tenants(self):
         """Load existing tenant configurations and create initial profiles"""
         try:
             if self.tenant_config_path.exists():
-                with open(self.tenant_config_path, 'r') as f:
-                    tenant_config = yaml.safe_load(f)
+                tenant_config = _load_yaml_cached(self.tenant_config_path)
                 
-                # Create profiles for existing tenants
-                for tenant in tenant_config.get('tenants', []):
-                    profile = self._create_profile_from_tenant(tenant)
-                    if profile:
-                        self.profiles[profile.tenant_id] = profile
-                        logger.info(f"Created profile for existing tenant: {profile.organization_name}")
+                # Create profiles for existing tenants, sharing one creation timestamp
+                now = datetime.now()
+                create = self._create_profile_from_tenant
+                store = self._store_profile
+                for tenant in tenant_config.get('tenants', ()):
+                    store(create(tenant, now))
+                logger.debug("Created profiles for %d existing tenants", len(self.profiles))
         except Exception as e:
             logger.error(f"Error loading existing tenants: {e}")
     
-    def _create_profile_from_tenant(self, tenant: Dict) -> Optional[CustomerProfile]:
+    def _create_profile_from_tenant(self, tenant: Dict, now: datetime) -> CustomerProfile:
         """Create a customer profile from existing tenant configuration"""
-        try:
-            # Infer sector and use case from organization name and SLA tier
-            org_name = tenant.get('name', 'Unknown')
-            sla_tier = tenant.get('sla_tier', 'basic')
-            
-            # Simple inference logic - can be enhanced with ML
-            sector = self._infer_sector_from_name(org_name)
-            use_case = self._infer_use_case_from_sector(sector)
-            
-            return CustomerProfile(
-                tenant_id=tenant.get('id', 'unknown'),
-                organization_name=org_name,
-                sector=sector,
-                use_case_category=use_case,
-                specific_use_cases=[use_case],
-                target_user_base=self._estimate_user_base(sla_tier),
-                geographical_coverage=['India'],  # Default assumption
-                languages_required=['English', 'Hindi'],  # Default assumption
-                business_goals=['Improve service accessibility', 'Reduce operational costs'],
-                success_metrics=['User satisfaction', 'Service efficiency'],
-                sla_tier=sla_tier,
-                profile_created_date=datetime.now(),
-                last_updated=datetime.now(),
-                profile_status='active',
-                contact_email=f"admin@{org_name.lower().replace(' ', '')}.com"
-            )
-        except Exception as e:
-            logger.error(f"Error creating profile from tenant {tenant}: {e}")
-            return None
-    
-    def _infer_sector_from_name(self, org_name: str) -> str:
-        """Infer sector from organization name"""
-        org_lower = org_name.lower()
-        
-        # Government indicators
-        if any(word in org_lower for word in ['ministry', 'department', 'government', 'govt', 'public']):
-            return 'government'
+        org_name = tenant.get('name', 'Unknown')
+        sla_tier = tenant.get('sla_tier', 'basic')
         
-        # Healthcare indicators
-        if any(word in org_lower for word in ['hospital', 'medical', 'health', 'clinic', 'pharma']):
-            return 'healthcare'
+        # Use what the tenant config declares; infer from name and SLA tier only when missing
+        sector = tenant.get('sector') or self._infer_sector_from_name(org_name)
+        use_case = tenant.get('use_case_category') or self._infer_use_case_from_sector(sector)
+        target_user_base = tenant.get('target_user_base')
+        if target_user_base is None:
+            target_user_base = self._estimate_user_base(sla_tier)
+        geographical_coverage = tenant.get('geographical_coverage')
+        languages_required = tenant.get('languages_required')
         
-        # Education indicators
-        if any(word in org_lower for word in ['university', 'college', 'school', 'education', 'academy']):
-            return 'education'
+        return CustomerProfile(
+            tenant_id=tenant.get('id', 'unknown'),
+            organization_name=org_name,
+            sector=_intern(sector),
+            use_case_category=_intern(use_case),
+            specific_use_cases=[use_case],
+            target_user_base=target_user_base,
+            # Default assumptions when the tenant config does not say
+            geographical_coverage=['India'] if geographical_coverage is None else geographical_coverage,
+            languages_required=['English', 'Hindi'] if languages_required is None else languages_required,
+            business_goals=['Improve service accessibility', 'Reduce operational costs'],
+            success_metrics=['User satisfaction', 'Service efficiency'],
+            sla_tier=_intern(sla_tier),
+            profile_created_date=now,
+            last_updated=now,
+            profile_status='active',
+            contact_email=f"admin@{org_name.lower().replace(' ', '')}.com"
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _infer_sector_from_name(org_name: str) -> str:
+        """Infer sector from organization name"""
+        tokens = set(_NAME_TOKEN_SPLIT.split(org_name.lower()))
         
-        # NGO indicators
-        if any(word in org_lower for word in ['foundation', 'trust', 'ngo', 'charity', 'social']):
-            return 'NGO'
+        # First sector (in priority order) with a keyword among the name's words
+        for sector, keywords in _SECTOR_KEYWORDS:
+            if not tokens.isdisjoint(keywords):
+                return sector
         
         # Default to private sector
-            return 'private'
+        return 'private'
     
-    def _infer_use_case_from_sector(self, sector: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _infer_use_case_from_sector(sector: str) -> str:
         """Infer use case category from sector"""
         sector_use_cases = {
             'government': 'citizen_services',
@@ -133,7 +339,9 @@ class CustomerProfiler:
         }
         return sector_use_cases.get(sector, 'general')
     
-    def _estimate_user_base(self, sla_tier: str) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _estimate_user_base(sla_tier: str) -> int:
         """Estimate user base based on SLA tier"""
         tier_estimates = {
             'premium': 1000000,  # 1M users
@@ -142,8 +350,15 @@ class CustomerProfiler:
         }
         return tier_estimates.get(sla_tier, 10000)
     
-    def create_profile_from_form(self, form_data: Dict[str, Any]) -> CustomerProfile:
-        """Create a new customer profile from application form data"""
+    def create_profile_from_form(self, form_data: Union[Dict[str, Any], Any]) -> CustomerProfile:
+        """Create a new customer profile from application form data
+        
+        Accepts a raw form dict, which is validated here, or an already validated
+        CustomerProfileCreate model, whose attributes are read directly.
+        """
+        if not isinstance(form_data, dict):
+            return self._create_profile_from_model(form_data)
+        
         try:
             # Validate required fields
             required_fields = ['organization_name', 'sector', 'use_case_category', 'target_user_base']
@@ -155,15 +370,15 @@ class CustomerProfiler:
             profile = CustomerProfile(
                 tenant_id=form_data.get('tenant_id', self._generate_tenant_id()),
                 organization_name=form_data['organization_name'],
-                sector=form_data['sector'],
-                use_case_category=form_data['use_case_category'],
+                sector=_intern(form_data['sector']),
+                use_case_category=_intern(form_data['use_case_category']),
                 specific_use_cases=form_data.get('specific_use_cases', []),
                 target_user_base=form_data['target_user_base'],
                 geographical_coverage=form_data.get('geographical_coverage', ['India']),
                 languages_required=form_data.get('languages_required', ['English']),
                 business_goals=form_data.get('business_goals', []),
                 success_metrics=form_data.get('success_metrics', []),
-                sla_tier=form_data.get('sla_tier', 'basic'),
+                sla_tier=_intern(form_data.get('sla_tier', 'basic')),
                 profile_created_date=datetime.now(),
                 last_updated=datetime.now(),
                 profile_status='pending',
@@ -178,8 +393,8 @@ class CustomerProfiler:
             self._validate_profile(profile)
             
             # Store profile
-            self.profiles[profile.tenant_id] = profile
-            logger.info(f"Created new profile for {profile.organization_name}")
+            self._store_profile(profile)
+            logger.info("Created new profile for %s", profile.organization_name)
             
             return profile
             
@@ -187,6 +402,34 @@ class CustomerProfiler:
             logger.error(f"Error creating profile from form data: {e}")
             raise
     
+    def _create_profile_from_model(self, model: Any) -> CustomerProfile:
+        """Create a profile from a validated CustomerProfileCreate without re-validating or copying it"""
+        now = datetime.now()
+        profile = CustomerProfile(
+            tenant_id=getattr(model, 'tenant_id', None) or self._generate_tenant_id(),
+            organization_name=model.organization_name,
+            sector=_intern(model.sector),
+            use_case_category=_intern(model.use_case_category),
+            specific_use_cases=model.specific_use_cases,
+            target_user_base=model.target_user_base,
+            geographical_coverage=model.geographical_coverage or ['India'],
+            languages_required=model.languages_required or ['English'],
+            business_goals=model.business_goals,
+            success_metrics=model.success_metrics,
+            sla_tier=_intern(model.sla_tier),
+            profile_created_date=now,
+            last_updated=now,
+            profile_status='pending',
+            contact_email=model.contact_email,
+            contact_phone=model.contact_phone,
+            industry=model.industry,
+            annual_revenue=model.annual_revenue,
+            employee_count=model.employee_count
+        )
+        self._store_profile(profile)
+        logger.info("Created new profile for %s", profile.organization_name)
+        return profile
+    
     def _generate_tenant_id(self) -> str:
         """Generate a unique tenant ID"""
         import uuid
@@ -195,16 +438,11 @@ class CustomerProfiler:
     def _validate_profile(self, profile: CustomerProfile):
         """Validate profile completeness and consistency"""
         # Validate sector
-        valid_sectors = ['government', 'private', 'NGO', 'healthcare', 'education']
-        if profile.sector not in valid_sectors:
+        if profile.sector not in _VALID_SECTORS:
             raise ValueError(f"Invalid sector: {profile.sector}")
         
         # Validate use case category
-        valid_use_cases = [
-            'citizen_services', 'healthcare', 'education', 'business_operations',
-            'community_services', 'content_localization', 'patient_communication'
-        ]
-        if profile.use_case_category not in valid_use_cases:
+        if profile.use_case_category not in _VALID_USE_CASES:
             raise ValueError(f"Invalid use case category: {profile.use_case_category}")
         
         # Validate target user base
@@ -212,7 +450,7 @@ class CustomerProfiler:
             raise ValueError("Target user base must be positive")
         
         # Validate contact email
-        if not profile.contact_email or '@' not in profile.contact_email:
+        if not profile.contact_email or not _EMAIL_RE.match(profile.contact_email):
             raise ValueError("Invalid contact email")
     
     def update_profile(self, tenant_id: str, updates: Dict[str, Any]) -> CustomerProfile:
@@ -220,60 +458,110 @@ class CustomerProfiler:
         if tenant_id not in self.profiles:
             raise ValueError(f"Profile not found for tenant: {tenant_id}")
         
-        profile = self.profiles[tenant_id]
+        unknown_fields = updates.keys() - _UPDATABLE_FIELDS
+        if unknown_fields:
+            raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown_fields))}")
         
-        # Update fields
-        for field, value in updates.items():
-            if hasattr(profile, field):
-                setattr(profile, field, value)
-        
-        # Update timestamp
-        profile.last_updated = datetime.now()
+        profile = self.profiles[tenant_id]
+        self._track_profile(profile, -1)
         
-        # Validate updated profile
-        self._validate_profile(profile)
+        try:
+            # Update fields
+            for field, value in updates.items():
+                setattr(profile, field, _intern(value) if field in _INTERNED_FIELDS else value)
+            
+            # Update timestamp
+            profile.last_updated = datetime.now()
+            
+            # Validate updated profile
+            self._validate_profile(profile)
+        finally:
+            self._track_profile(profile, 1)
+            self.version += 1
         
-        logger.info(f"Updated profile for {profile.organization_name}")
+        logger.info("Updated profile for %s", profile.organization_name)
         return profile
     
     def get_profile(self, tenant_id: str) -> Optional[CustomerProfile]:
         """Retrieve a customer profile by tenant ID"""
         return self.profiles.get(tenant_id)
     
+    def get_profile_view(self, tenant_id: str) -> Optional[CustomerProfileView]:
+        """Retrieve a shared read-only view of a profile, built once per profile change"""
+        view = self._views.get(tenant_id)
+        if view is None:
+            profile = self.profiles.get(tenant_id)
+            if profile is None:
+                return None
+            view = self._views[tenant_id] = profile.to_view()
+        return view
+    
     def get_profiles_by_sector(self, sector: str) -> List[CustomerProfile]:
         """Get all profiles for a specific sector"""
-        return [profile for profile in self.profiles.values() if profile.sector == sector]
+        return [self.profiles[tenant_id] for tenant_id in self._by_sector.get(sector, ())]
     
     def get_profiles_by_use_case(self, use_case: str) -> List[CustomerProfile]:
         """Get all profiles for a specific use case"""
-        return [profile for profile in self.profiles.values() if profile.use_case_category == use_case]
+        return [self.profiles[tenant_id] for tenant_id in self._by_use_case.get(use_case, ())]
+    
+    def get_sector_metrics(self, sector: str) -> Dict[str, Any]:
+        """Get SLA / use case distribution and user totals for a sector without scanning profiles"""
+        agg = self._sector_agg.get(sector)
+        if agg is None:
+            return {'profile_count': 0, 'total_target_users': 0,
+                    'sla_distribution': {}, 'use_case_distribution': {}}
+        return {
+            'profile_count': agg['count'],
+            'total_target_users': agg['users'],
+            'sla_distribution': {k: v for k, v in agg['sla'].items() if v},
+            'use_case_distribution': {k: v for k, v in agg['uc'].items() if v}
+        }
     
     def search_profiles(self, query: str) -> List[CustomerProfile]:
-        """Search profiles by organization name or description"""
-        query_lower = query.lower()
-        results = []
+        """Search profiles by organization name, sector or use case
         
-        for profile in self.profiles.values():
-            if (query_lower in profile.organization_name.lower() or
-                query_lower in profile.sector.lower() or
-                query_lower in profile.use_case_category.lower()):
-                results.append(profile)
+        Every word of the query must prefix-match a token of the profile.
+        """
+        query_tokens = _SEARCH_TOKEN_RE.findall(query.lower())
+        if not query_tokens:
+            return list(self.profiles.values())
         
-        return results
+        matches = None
+        for query_token in query_tokens:
+            # Union the tenants of every indexed token starting with this query word
+            token_matches = set()
+            sorted_tokens = self._sorted_tokens
+            for i in range(bisect_left(sorted_tokens, query_token), len(sorted_tokens)):
+                token = sorted_tokens[i]
+                if not token.startswith(query_token):
+                    break
+                token_matches |= self._token_index[token]
+            matches = token_matches if matches is None else matches & token_matches
+            if not matches:
+                return []
+        
+        # Profile insertion order, like the unfiltered listing
+        return [profile for tenant_id, profile in self.profiles.items() if tenant_id in matches]
     
     def deactivate_profile(self, tenant_id: str) -> bool:
         """Deactivate a customer profile"""
         if tenant_id in self.profiles:
+            self._track_profile(self.profiles[tenant_id], -1)
             self.profiles[tenant_id].profile_status = 'inactive'
             self.profiles[tenant_id].last_updated = datetime.now()
-            logger.info(f"Deactivated profile for tenant: {tenant_id}")
+            self._track_profile(self.profiles[tenant_id], 1)
+            self.version += 1
+            logger.info("Deactivated profile for tenant: %s", tenant_id)
             return True
         return False
     
     def export_profiles(self, format: str = 'json') -> str:
         """Export all profiles in specified format"""
-        if format == 'json':
-            profiles_data = [asdict(profile) for profile in self.profiles.values()]
+        if format == 'json' and orjson is not None:
+            # orjson serializes the dataclasses and datetimes natively
+            return orjson.dumps(list(self.profiles.values()), option=orjson.OPT_INDENT_2).decode()
+        elif format == 'json':
+            profiles_data = [_shallow_dict(profile) for profile in self.profiles.values()]
             # Convert datetime objects to strings for JSON serialization
             for profile_data in profiles_data:
                 profile_data['profile_created_date'] = profile_data['profile_created_date'].isoformat()
@@ -282,25 +570,25 @@ class CustomerProfiler:
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
+    def export_profiles_iter(self) -> Iterator[bytes]:
+        """Yield the JSON export one profile at a time, for writing large exports to a stream"""
+        if orjson is None:
+            yield self.export_profiles('json').encode()
+            return
+        yield b'['
+        for i, profile in enumerate(list(self.profiles.values())):
+            yield (b',' if i else b'') + orjson.dumps(profile)
+        yield b']'
+    
     def get_profile_statistics(self) -> Dict[str, Any]:
         """Get statistics about customer profiles"""
-        total_profiles = len(self.profiles)
-        sector_counts = {}
-        use_case_counts = {}
-        sla_tier_counts = {}
-        
-        for profile in self.profiles.values():
-            sector_counts[profile.sector] = sector_counts.get(profile.sector, 0) + 1
-            use_case_counts[profile.use_case_category] = use_case_counts.get(profile.use_case_category, 0) + 1
-            sla_tier_counts[profile.sla_tier] = sla_tier_counts.get(profile.sla_tier, 0) + 1
-        
         return {
-            'total_profiles': total_profiles,
-            'sector_distribution': sector_counts,
-            'use_case_distribution': use_case_counts,
-            'sla_tier_distribution': sla_tier_counts,
-            'active_profiles': len([p for p in self.profiles.values() if p.profile_status == 'active']),
-            'pending_profiles': len([p for p in self.profiles.values() if p.profile_status == 'pending'])
+            'total_profiles': len(self.profiles),
+            'sector_distribution': {k: len(v) for k, v in self._by_sector.items()},
+            'use_case_distribution': {k: len(v) for k, v in self._by_use_case.items()},
+            'sla_tier_distribution': {k: len(v) for k, v in self._by_sla.items()},
+            'active_profiles': len(self._by_status.get('active', ())),
+            'pending_profiles': len(self._by_status.get('pending', ()))
         }
 
 # Example usage and testing
@@ -10,32 +10,68 @@ This module provides comprehensive data models including:
 - Data serialization and transformation functions
 """
 
+import csv
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+import orjson
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Collection, Dict, Iterator, List, Literal, Optional, Tuple, Union, get_args
 from enum import Enum
-from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Boolean, Text, JSON, ForeignKey
+from sqlalchemy import create_engine, insert, select, Column, Index, String, Integer, Float, DateTime, Boolean, Text, JSON, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker, relationship, selectinload, Session
 from sqlalchemy.sql import text
-from pydantic import BaseModel, Field, validator
-import yaml
-from pathlib import Path
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, validate_email
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the timezone-less DateTime columns"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 # SQLAlchemy setup
-Base = declarative_base()
+class SerializableModel:
+    """Declarative base mixin providing a column-driven to_dict"""
+    
+    # Filled in per model by _bind_meta once the tables are declared
+    _COLS: Tuple[str, ...] = ()
+    _DT_COLS: frozenset = frozenset()
+    
+    @classmethod
+    def _bind_meta(cls) -> None:
+        """Cache column names and DateTime columns, and generate to_dict from them"""
+        columns = cls.__table__.columns
+        cls._COLS = tuple(column.key for column in columns)
+        cls._DT_COLS = frozenset(column.key for column in columns if isinstance(column.type, DateTime))
+        cls.to_dict = _compile_record_converter(f"{cls.__name__}_to_dict", cls._COLS)
+    
+    # to_dict(self) -> {column: value}, generated per model by _bind_meta; datetimes are left for
+    # orjson to encode
+    to_dict: Callable[[Any], Dict[str, Any]]
+
+Base = declarative_base(cls=SerializableModel)
+
+# Closed enumerations are validated as Literal membership checks rather than regexes
+Sector = Literal['government', 'healthcare', 'education', 'private', 'NGO']
+SLATier = Literal['premium', 'standard', 'basic']
+ProfileStatus = Literal['active', 'inactive', 'pending']
+RecommendationType = Literal['performance', 'reliability', 'capacity', 'feature']
+Priority = Literal['critical', 'high', 'medium', 'low']
+ImpactLevel = Literal['high', 'medium', 'low']
 
 # Pydantic models for API validation
+_REQUEST_MODEL_CONFIG = ConfigDict(str_strip_whitespace=False, extra='forbid')
+
 class CustomerProfileCreate(BaseModel):
     """Pydantic model for creating customer profiles"""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     organization_name: str = Field(..., min_length=1, max_length=200)
-    sector: str = Field(..., regex="^(government|healthcare|education|private|NGO)$")
+    sector: Sector
     use_case_category: str = Field(..., min_length=1, max_length=100)
     specific_use_cases: List[str] = Field(default_factory=list)
     target_user_base: int = Field(..., gt=0)
@@ -43,20 +79,30 @@ class CustomerProfileCreate(BaseModel):
     languages_required: List[str] = Field(default_factory=list)
     business_goals: List[str] = Field(default_factory=list)
     success_metrics: List[str] = Field(default_factory=list)
-    sla_tier: str = Field(..., regex="^(premium|standard|basic)$")
-    contact_email: str = Field(..., regex=r"^[^@]+@[^@]+\.[^@]+$")
+    sla_tier: SLATier
+    contact_email: EmailStr
     contact_phone: Optional[str] = None
     industry: Optional[str] = None
     annual_revenue: Optional[float] = Field(None, gt=0)
     employee_count: Optional[int] = Field(None, gt=0)
     
-    @validator('target_user_base')
+    @field_validator('use_case_category')
+    @classmethod
+    def validate_use_case(cls, v):
+        # Business rule previously re-checked by DataValidator after model validation
+        if v not in DataValidator._USE_CASE_SET:
+            raise ValueError(DataValidator._USE_CASE_ERROR)
+        return v
+    
+    @field_validator('target_user_base')
+    @classmethod
     def validate_user_base(cls, v):
         if v > 100000000:  # 100M users max
             raise ValueError('Target user base too large')
         return v
     
-    @validator('annual_revenue')
+    @field_validator('annual_revenue')
+    @classmethod
     def validate_revenue(cls, v):
         if v is not None and v > 1000000000000:  # 1T revenue max
             raise ValueError('Annual revenue too large')
@@ -64,8 +110,10 @@ class CustomerProfileCreate(BaseModel):
 
 class CustomerProfileUpdate(BaseModel):
     """Pydantic model for updating customer profiles"""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     organization_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    sector: Optional[str] = Field(None, regex="^(government|healthcare|education|private|NGO)$")
+    sector: Optional[Sector] = None
     use_case_category: Optional[str] = Field(None, min_length=1, max_length=100)
     specific_use_cases: Optional[List[str]] = None
     target_user_base: Optional[int] = Field(None, gt=0)
@@ -73,16 +121,25 @@ class CustomerProfileUpdate(BaseModel):
     languages_required: Optional[List[str]] = None
     business_goals: Optional[List[str]] = None
     success_metrics: Optional[List[str]] = None
-    sla_tier: Optional[str] = Field(None, regex="^(premium|standard|basic)$")
-    contact_email: Optional[str] = Field(None, regex=r"^[^@]+@[^@]+\.[^@]+$")
+    sla_tier: Optional[SLATier] = None
+    contact_email: Optional[EmailStr] = None
     contact_phone: Optional[str] = None
     industry: Optional[str] = None
     annual_revenue: Optional[float] = Field(None, gt=0)
     employee_count: Optional[int] = Field(None, gt=0)
-    profile_status: Optional[str] = Field(None, regex="^(active|inactive|pending)$")
+    profile_status: Optional[ProfileStatus] = None
+    
+    @field_validator('use_case_category')
+    @classmethod
+    def validate_use_case(cls, v):
+        if v is not None and v not in DataValidator._USE_CASE_SET:
+            raise ValueError(DataValidator._USE_CASE_ERROR)
+        return v
 
 class ValueEstimateCreate(BaseModel):
     """Pydantic model for creating value estimates"""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     tenant_id: str = Field(..., min_length=1)
     cost_savings: float = Field(..., ge=0)
     user_reach_impact: int = Field(..., ge=0)
@@ -97,13 +154,15 @@ class ValueEstimateCreate(BaseModel):
 
 class RecommendationCreate(BaseModel):
     """Pydantic model for creating recommendations"""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     tenant_id: str = Field(..., min_length=1)
-    recommendation_type: str = Field(..., regex="^(performance|reliability|capacity|feature)$")
-    priority: str = Field(..., regex="^(critical|high|medium|low)$")
+    recommendation_type: RecommendationType
+    priority: Priority
     title: str = Field(..., min_length=1, max_length=200)
     description: str = Field(..., min_length=1)
-    expected_impact: str = Field(..., regex="^(high|medium|low)$")
-    implementation_effort: str = Field(..., regex="^(high|medium|low)$")
+    expected_impact: ImpactLevel
+    implementation_effort: ImpactLevel
     technical_details: Optional[Dict[str, Any]] = None
     sector_context: Optional[str] = None
     use_case_context: Optional[str] = None
@@ -124,8 +183,8 @@ class CustomerProfile(Base):
     business_goals = Column(JSON, nullable=False)
     success_metrics = Column(JSON, nullable=False)
     sla_tier = Column(String(20), nullable=False, index=True)
-    profile_created_date = Column(DateTime, nullable=False, default=datetime.utcnow)
-    last_updated = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    profile_created_date = Column(DateTime, nullable=False, default=_utcnow)
+    last_updated = Column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
     profile_status = Column(String(20), nullable=False, default='pending', index=True)
     contact_email = Column(String(200), nullable=False)
     contact_phone = Column(String(50))
@@ -133,33 +192,30 @@ class CustomerProfile(Base):
     annual_revenue = Column(Float)
     employee_count = Column(Integer)
     
-    # Relationships
-    value_estimates = relationship("ValueEstimate", back_populates="customer_profile")
-    recommendations = relationship("Recommendation", back_populates="customer_profile")
-    profile_history = relationship("ProfileHistory", back_populates="customer_profile")
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert profile to dictionary"""
-        data = asdict(self)
-        # Convert datetime objects to ISO strings
-        data['profile_created_date'] = self.profile_created_date.isoformat()
-        data['last_updated'] = self.last_updated.isoformat()
-        return data
+    # Relationships; lazy='raise' turns accidental N+1 loads into errors, load them via PROFILE_RELATION_LOADERS
+    value_estimates = relationship("ValueEstimate", back_populates="customer_profile", lazy='raise')
+    recommendations = relationship("Recommendation", back_populates="customer_profile", lazy='raise')
+    profile_history = relationship("ProfileHistory", back_populates="customer_profile", lazy='raise')
+    
+    # Column names update_from_dict may set; filled in by _bind_model_columns
+    _UPDATABLE: frozenset = frozenset()
     
     def update_from_dict(self, updates: Dict[str, Any]) -> None:
         """Update profile from dictionary"""
-        for key, value in updates.items():
-            if hasattr(self, key) and key not in ['tenant_id', 'profile_created_date']:
-                setattr(self, key, value)
-        self.last_updated = datetime.utcnow()
+        for key in updates.keys() & self._UPDATABLE:
+            setattr(self, key, updates[key])
+        self.last_updated = _utcnow()
 
 class ValueEstimate(Base):
     """SQLAlchemy model for value estimates"""
     __tablename__ = 'value_estimates'
+    __table_args__ = (
+        Index('ix_ve_tenant_date', 'tenant_id', text('calculation_date DESC')),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    tenant_id = Column(String(50), ForeignKey('customer_profiles.tenant_id'), nullable=False, index=True)
-    calculation_date = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    tenant_id = Column(String(50), ForeignKey('customer_profiles.tenant_id'), nullable=False)
+    calculation_date = Column(DateTime, nullable=False, default=_utcnow, index=True)
     cost_savings = Column(Float, nullable=False)
     user_reach_impact = Column(Integer, nullable=False)
     efficiency_gains = Column(Float, nullable=False)
@@ -174,12 +230,6 @@ class ValueEstimate(Base):
     
     # Relationships
     customer_profile = relationship("CustomerProfile", back_populates="value_estimates")
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert estimate to dictionary"""
-        data = asdict(self)
-        data['calculation_date'] = self.calculation_date.isoformat()
-        return data
 
 class Recommendation(Base):
     """SQLAlchemy model for recommendations"""
@@ -194,7 +244,7 @@ class Recommendation(Base):
     expected_impact = Column(String(20), nullable=False)
     implementation_effort = Column(String(20), nullable=False)
     status = Column(String(20), nullable=False, default='pending', index=True)
-    created_date = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_date = Column(DateTime, nullable=False, default=_utcnow)
     implemented_date = Column(DateTime)
     confidence_score = Column(Float, nullable=False, default=0.0)
     business_value = Column(Float, nullable=False, default=0.0)
@@ -205,14 +255,6 @@ class Recommendation(Base):
     # Relationships
     customer_profile = relationship("CustomerProfile", back_populates="recommendations")
     implementation_tracking = relationship("ImplementationTracking", back_populates="recommendation", uselist=False)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert recommendation to dictionary"""
-        data = asdict(self)
-        data['created_date'] = self.created_date.isoformat()
-        if self.implemented_date:
-            data['implemented_date'] = self.implemented_date.isoformat()
-        return data
 
 class ProfileHistory(Base):
     """SQLAlchemy model for profile change history"""
@@ -224,17 +266,11 @@ class ProfileHistory(Base):
     field_name = Column(String(100))
     old_value = Column(Text)
     new_value = Column(Text)
-    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    changed_at = Column(DateTime, nullable=False, default=_utcnow)
     changed_by = Column(String(100))  # system, user, api
     
     # Relationships
     customer_profile = relationship("CustomerProfile", back_populates="profile_history")
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert history record to dictionary"""
-        data = asdict(self)
-        data['changed_at'] = self.changed_at.isoformat()
-        return data
 
 class ImplementationTracking(Base):
     """SQLAlchemy model for recommendation implementation tracking"""
@@ -253,42 +289,74 @@ class ImplementationTracking(Base):
     
     # Relationships
     recommendation = relationship("Recommendation", back_populates="implementation_tracking")
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert tracking record to dictionary"""
-        data = asdict(self)
-        if self.implementation_start_date:
-            data['implementation_start_date'] = self.implementation_start_date.isoformat()
-        if self.implementation_end_date:
-            data['implementation_end_date'] = self.implementation_end_date.isoformat()
-        return data
 
 class QoSMetrics(Base):
     """SQLAlchemy model for QoS metrics cache"""
     __tablename__ = 'qos_metrics_cache'
+    __table_args__ = (
+        Index('ix_qos_tenant_ts', 'tenant_id', text('timestamp DESC'), 'service_type'),
+        # Rows arrive in time order, so a BRIN range index stays tiny where a B-tree would bloat
+        Index('ix_qos_ts_brin', 'timestamp', postgresql_using='brin'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    tenant_id = Column(String(50), nullable=False, index=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    tenant_id = Column(String(50), nullable=False)
+    timestamp = Column(DateTime, nullable=False)
     service_type = Column(String(50), nullable=False)
     latency_ms = Column(Float, nullable=False)
     throughput_rps = Column(Float, nullable=False)
     error_rate = Column(Float, nullable=False)
     availability_percent = Column(Float, nullable=False)
     response_time_p95 = Column(Float, nullable=False)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to dictionary"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+
+# Eager-load options for profile queries that need related rows: 2 SELECTs instead of N+1
+PROFILE_RELATION_LOADERS = {
+    'value_estimates': selectinload(CustomerProfile.value_estimates),
+    'recommendations': selectinload(CustomerProfile.recommendations),
+    'profile_history': selectinload(CustomerProfile.profile_history),
+}
+
+def _compile_record_converter(name: str, fields: Tuple[str, ...], isoformat_fields: Collection[str] = ()):
+    """Generate a specialized object-to-dict function with every attribute read inlined"""
+    items = []
+    for field in fields:
+        if field in isoformat_fields:
+            items.append(f"{field!r}: o.{field}.isoformat() if o.{field} is not None else None")
+        else:
+            items.append(f"{field!r}: o.{field}")
+    source = f"def {name}(o):\n    return {{{', '.join(items)}}}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<generated {name}>", 'exec'), namespace)
+    return namespace[name]
+
+def _bind_model_columns() -> None:
+    """Bind per-class column metadata for every mapped model once, at import"""
+    for mapper in Base.registry.mappers:
+        mapper.class_._bind_meta()
+    CustomerProfile._UPDATABLE = frozenset(CustomerProfile._COLS) - {'tenant_id', 'profile_created_date'}
+
+_bind_model_columns()
 
 # Database manager class
 class DatabaseManager:
     """Database management class for the BI system"""
     
+    # Rows per multi-row INSERT when flushing many objects (ProfileHistory, QoSMetrics)
+    INSERT_PAGE_SIZE = 1000
+    
     def __init__(self, database_url: str):
-        self.engine = create_engine(database_url)
+        url = make_url(database_url)
+        engine_options = {'pool_pre_ping': True, 'insertmanyvalues_page_size': self.INSERT_PAGE_SIZE}
+        if url.get_backend_name() != 'sqlite':
+            # Keep a warm pool of server connections so sessions reuse them instead of reconnecting
+            engine_options.update(pool_size=20, max_overflow=10, pool_recycle=1800)
+        if url.get_driver_name() == 'psycopg2':
+            # INSERTs are batched by insertmanyvalues_page_size; this pages UPDATE/DELETE executemany
+            engine_options.update(
+                executemany_mode='values_plus_batch',
+                executemany_batch_page_size=self.INSERT_PAGE_SIZE,
+            )
+        self.engine = create_engine(url, **engine_options)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self._create_tables()
     
@@ -301,14 +369,43 @@ class DatabaseManager:
             logger.error(f"Error creating database tables: {e}")
             raise
     
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Provide a session that commits on success, rolls back on error and always closes"""
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     def get_session(self) -> Session:
-        """Get database session"""
+        """Get database session; prefer session_scope(), which also commits and closes it"""
         return self.SessionLocal()
     
     def close_session(self, session: Session):
         """Close database session"""
         session.close()
     
+    def get_profiles(self, session: Session, tenant_ids: Optional[List[str]] = None,
+                     relations: Tuple[str, ...] = ()) -> List[CustomerProfile]:
+        """Load profiles, eagerly loading only the named relationships"""
+        query = select(CustomerProfile).options(*(PROFILE_RELATION_LOADERS[name] for name in relations))
+        if tenant_ids is not None:
+            query = query.where(CustomerProfile.tenant_id.in_(tenant_ids))
+        return list(session.scalars(query))
+    
+    def bulk_insert(self, model, rows: List[Dict[str, Any]]) -> int:
+        """Insert many rows of a model in batched multi-row INSERT statements"""
+        if not rows:
+            return 0
+        with self.session_scope() as session:
+            session.execute(insert(model), rows)
+        return len(rows)
+    
     def execute_migration(self, migration_sql: str) -> bool:
         """Execute database migration"""
         try:
@@ -321,167 +418,223 @@ class DatabaseManager:
             logger.error(f"Error executing migration: {e}")
             return False
     
-    def backup_database(self, backup_path: str) -> bool:
-        """Create database backup"""
+    BACKUP_FORMATS = ('json', 'csv')
+    
+    def backup_database(self, backup_path: str, format: str = 'json') -> bool:
+        """Create database backup of the customer profiles table in the requested format
+        
+        ``format='json'`` writes a JSON array of row objects on every backend. ``format='csv'``
+        writes a header row plus one line per row; with psycopg2 the file comes straight from a
+        server-side COPY, other drivers stream the rows through the csv module. The format is
+        never inferred from the backend, so backup_path always holds what the caller asked for.
+        """
         try:
+            if format not in self.BACKUP_FORMATS:
+                raise ValueError(f"Unsupported backup format: {format}")
+            
             # This is a simplified backup - in production, use proper backup tools
-            with self.engine.connect() as connection:
-                result = connection.execute(text("SELECT * FROM customer_profiles"))
-                profiles = [dict(row) for row in result]
-                
-                with open(backup_path, 'w') as f:
-                    json.dump(profiles, f, indent=2, default=str)
+            if format == 'json':
+                self._stream_table_to_json('customer_profiles', backup_path)
+            elif self.engine.dialect.driver == 'psycopg2':
+                self._copy_table_to_file('customer_profiles', backup_path)
+            else:
+                self._stream_table_to_csv('customer_profiles', backup_path)
             
-            logger.info(f"Database backup created at {backup_path}")
+            logger.info(f"Database backup ({format}) created at {backup_path}")
             return True
         except Exception as e:
             logger.error(f"Error creating database backup: {e}")
             return False
+    
+    def _copy_table_to_file(self, table_name: str, backup_path: str) -> None:
+        """Dump a table server-side with psycopg2's COPY ... TO STDOUT, bypassing per-row Python work"""
+        raw_connection = self.engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor, open(backup_path, 'w', newline='') as f:
+                cursor.copy_expert(f"COPY {table_name} TO STDOUT WITH (FORMAT csv, HEADER)", f)
+        finally:
+            raw_connection.close()
+    
+    def _stream_table_to_csv(self, table_name: str, backup_path: str) -> None:
+        """Stream a table into CSV matching the COPY output: JSON columns as JSON text"""
+        table = Base.metadata.tables[table_name]
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=1000).execute(select(table))
+            
+            with open(backup_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(result.keys())
+                for row in result:
+                    writer.writerow([
+                        orjson.dumps(value).decode() if isinstance(value, (dict, list)) else value
+                        for value in row
+                    ])
+    
+    def _stream_table_to_json(self, table_name: str, backup_path: str) -> None:
+        """Stream a table into a JSON array, one row at a time"""
+        # Select through the mapped table so JSON and DateTime columns come back as Python values
+        # (SQLite would otherwise hand back JSON text that gets encoded a second time)
+        table = Base.metadata.tables[table_name]
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=1000).execute(select(table))
+            
+            with open(backup_path, 'wb') as f:
+                f.write(b'[')
+                separator = b'\n'
+                for row in result.mappings():
+                    f.write(separator)
+                    # default=str covers driver types orjson does not know, such as Decimal
+                    f.write(orjson.dumps(dict(row), default=str,
+                                         option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z))
+                    separator = b',\n'
+                f.write(b'\n]\n')
 
 # Data validation and transformation utilities
 class DataValidator:
     """Data validation utilities"""
     
+    # Stateless; the shared data_validator instance carries no per-instance __dict__
+    __slots__ = ()
+    
+    # Lookup tables and error messages are built once at import, not on every call
+    REQUIRED_PROFILE_FIELDS = ('organization_name', 'sector', 'use_case_category', 'target_user_base')
+    VALID_SECTORS = get_args(Sector)
+    VALID_USE_CASES = (
+        'citizen_services', 'healthcare', 'education', 'business_operations',
+        'community_services', 'content_localization', 'patient_communication'
+    )
+    VALID_SLA_TIERS = get_args(SLATier)
+    _SECTOR_SET = frozenset(VALID_SECTORS)
+    _USE_CASE_SET = frozenset(VALID_USE_CASES)
+    _SLA_TIER_SET = frozenset(VALID_SLA_TIERS)
+    _SECTOR_ERROR = f"Invalid sector. Must be one of: {', '.join(VALID_SECTORS)}"
+    _USE_CASE_ERROR = f"Invalid use case category. Must be one of: {', '.join(VALID_USE_CASES)}"
+    _SLA_TIER_ERROR = f"Invalid SLA tier. Must be one of: {', '.join(VALID_SLA_TIERS)}"
+    REQUIRED_ESTIMATE_FIELDS = ('tenant_id', 'cost_savings', 'user_reach_impact', 'efficiency_gains')
+    
     @staticmethod
-    def validate_customer_profile(profile_data: Dict[str, Any]) -> List[str]:
-        """Validate customer profile data and return validation errors"""
+    def _missing_fields(data: Dict[str, Any], required: Tuple[str, ...]) -> List[str]:
+        """Report required fields that are absent, None or empty strings (0 counts as present)"""
         errors = []
-        
-        # Required field validation
-        required_fields = ['organization_name', 'sector', 'use_case_category', 'target_user_base']
-        for field in required_fields:
-            if not profile_data.get(field):
+        for field in required:
+            value = data.get(field)
+            if value is None or value == '':
                 errors.append(f"Missing required field: {field}")
-        
-        # Sector validation
-        valid_sectors = ['government', 'healthcare', 'education', 'private', 'NGO']
-        if profile_data.get('sector') and profile_data['sector'] not in valid_sectors:
-            errors.append(f"Invalid sector. Must be one of: {', '.join(valid_sectors)}")
-        
-        # Use case validation
-        valid_use_cases = [
-            'citizen_services', 'healthcare', 'education', 'business_operations',
-            'community_services', 'content_localization', 'patient_communication'
-        ]
-        if profile_data.get('use_case_category') and profile_data['use_case_category'] not in valid_use_cases:
-            errors.append(f"Invalid use case category. Must be one of: {', '.join(valid_use_cases)}")
-        
-        # SLA tier validation
-        valid_sla_tiers = ['premium', 'standard', 'basic']
-        if profile_data.get('sla_tier') and profile_data['sla_tier'] not in valid_sla_tiers:
-            errors.append(f"Invalid SLA tier. Must be one of: {', '.join(valid_sla_tiers)}")
-        
-        # Numeric validation
-        if profile_data.get('target_user_base') and not isinstance(profile_data['target_user_base'], int):
-            errors.append("target_user_base must be an integer")
-        
-        if profile_data.get('target_user_base') and profile_data['target_user_base'] <= 0:
-            errors.append("target_user_base must be positive")
-        
-        # Email validation
-        if profile_data.get('contact_email') and '@' not in profile_data['contact_email']:
-            errors.append("Invalid contact email format")
-        
         return errors
     
     @staticmethod
-    def validate_value_estimate(estimate_data: Dict[str, Any]) -> List[str]:
-        """Validate value estimate data and return validation errors"""
-        errors = []
-        
-        # Required field validation
-        required_fields = ['tenant_id', 'cost_savings', 'user_reach_impact', 'efficiency_gains']
-        for field in required_fields:
-            if not estimate_data.get(field):
-                errors.append(f"Missing required field: {field}")
-        
-        # Numeric validation
-        if estimate_data.get('cost_savings') and estimate_data['cost_savings'] < 0:
-            errors.append("cost_savings must be non-negative")
-        
-        if estimate_data.get('user_reach_impact') and estimate_data['user_reach_impact'] < 0:
-            errors.append("user_reach_impact must be non-negative")
-        
-        if estimate_data.get('efficiency_gains') and (estimate_data['efficiency_gains'] < 0 or estimate_data['efficiency_gains'] > 100):
-            errors.append("efficiency_gains must be between 0 and 100")
-        
-        if estimate_data.get('quality_improvements') and (estimate_data['quality_improvements'] < 0 or estimate_data['quality_improvements'] > 100):
-            errors.append("quality_improvements must be between 0 and 100")
-        
-        if estimate_data.get('confidence_score') and (estimate_data['confidence_score'] < 0 or estimate_data['confidence_score'] > 100):
-            errors.append("confidence_score must be between 0 and 100")
-        
+    def _apply_rules(data: Dict[str, Any], rules: Dict[str, Callable[[Any, List[str]], None]],
+                     errors: List[str]) -> List[str]:
+        """Run each present, non-empty field through its rule in a single pass over the data"""
+        for key, value in data.items():
+            rule = rules.get(key)
+            if rule is not None and value is not None and value != '':
+                rule(value, errors)
         return errors
-
-class DataTransformer:
-    """Data transformation utilities"""
     
     @staticmethod
-    def profile_to_api_response(profile: CustomerProfile) -> Dict[str, Any]:
-        """Transform customer profile to API response format"""
-        return {
-            'tenant_id': profile.tenant_id,
-            'organization_name': profile.organization_name,
-            'sector': profile.sector,
-            'use_case_category': profile.use_case_category,
-            'specific_use_cases': profile.specific_use_cases,
-            'target_user_base': profile.target_user_base,
-            'geographical_coverage': profile.geographical_coverage,
-            'languages_required': profile.languages_required,
-            'business_goals': profile.business_goals,
-            'success_metrics': profile.success_metrics,
-            'sla_tier': profile.sla_tier,
-            'profile_status': profile.profile_status,
-            'contact_email': profile.contact_email,
-            'contact_phone': profile.contact_phone,
-            'industry': profile.industry,
-            'annual_revenue': profile.annual_revenue,
-            'employee_count': profile.employee_count,
-            'profile_created_date': profile.profile_created_date.isoformat(),
-            'last_updated': profile.last_updated.isoformat()
-        }
+    def validate_customer_profile(profile_data: Dict[str, Any]) -> List[str]:
+        """Validate customer profile data and return validation errors"""
+        errors = DataValidator._missing_fields(profile_data, DataValidator.REQUIRED_PROFILE_FIELDS)
+        return DataValidator._apply_rules(profile_data, _PROFILE_RULES, errors)
     
     @staticmethod
-    def value_estimate_to_api_response(estimate: ValueEstimate) -> Dict[str, Any]:
-        """Transform value estimate to API response format"""
-        return {
-            'id': estimate.id,
-            'tenant_id': estimate.tenant_id,
-            'calculation_date': estimate.calculation_date.isoformat(),
-            'cost_savings': estimate.cost_savings,
-            'user_reach_impact': estimate.user_reach_impact,
-            'efficiency_gains': estimate.efficiency_gains,
-            'quality_improvements': estimate.quality_improvements,
-            'total_value_score': estimate.total_value_score,
-            'calculation_methodology': estimate.calculation_methodology,
-            'sector_multiplier': estimate.sector_multiplier,
-            'use_case_multiplier': estimate.use_case_multiplier,
-            'confidence_score': estimate.confidence_score,
-            'roi_ratio': estimate.roi_ratio,
-            'payback_period_months': estimate.payback_period_months
-        }
+    def validate_value_estimate(estimate_data: Dict[str, Any]) -> List[str]:
+        """Validate value estimate data and return validation errors"""
+        errors = DataValidator._missing_fields(estimate_data, DataValidator.REQUIRED_ESTIMATE_FIELDS)
+        return DataValidator._apply_rules(estimate_data, _ESTIMATE_RULES, errors)
+
+def _check_sector(value: Any, errors: List[str]) -> None:
+    if value not in DataValidator._SECTOR_SET:
+        errors.append(DataValidator._SECTOR_ERROR)
+
+def _check_use_case(value: Any, errors: List[str]) -> None:
+    if value not in DataValidator._USE_CASE_SET:
+        errors.append(DataValidator._USE_CASE_ERROR)
+
+def _check_sla_tier(value: Any, errors: List[str]) -> None:
+    if value not in DataValidator._SLA_TIER_SET:
+        errors.append(DataValidator._SLA_TIER_ERROR)
+
+def _check_user_base(value: Any, errors: List[str]) -> None:
+    if not isinstance(value, int):
+        errors.append("target_user_base must be an integer")
+    elif value <= 0:
+        errors.append("target_user_base must be positive")
+
+def _check_contact_email(value: Any, errors: List[str]) -> None:
+    # Shares email-validator's parser with the EmailStr model fields
+    try:
+        validate_email(value)
+    except Exception:
+        errors.append("Invalid contact email format")
+
+def _non_negative_rule(field: str) -> Callable[[Any, List[str]], None]:
+    message = f"{field} must be non-negative"
+    def check(value: Any, errors: List[str]) -> None:
+        if value < 0:
+            errors.append(message)
+    return check
+
+def _percentage_rule(field: str) -> Callable[[Any, List[str]], None]:
+    message = f"{field} must be between 0 and 100"
+    def check(value: Any, errors: List[str]) -> None:
+        if not 0 <= value <= 100:
+            errors.append(message)
+    return check
+
+# Field -> rule dispatch tables, built once at import
+_PROFILE_RULES = {
+    'sector': _check_sector,
+    'use_case_category': _check_use_case,
+    'sla_tier': _check_sla_tier,
+    'target_user_base': _check_user_base,
+    'contact_email': _check_contact_email,
+}
+_ESTIMATE_RULES = {
+    'cost_savings': _non_negative_rule('cost_savings'),
+    'user_reach_impact': _non_negative_rule('user_reach_impact'),
+    'efficiency_gains': _percentage_rule('efficiency_gains'),
+    'quality_improvements': _percentage_rule('quality_improvements'),
+    'confidence_score': _percentage_rule('confidence_score'),
+}
+
+PROFILE_RESPONSE_FIELDS = (
+    'tenant_id', 'organization_name', 'sector', 'use_case_category', 'specific_use_cases',
+    'target_user_base', 'geographical_coverage', 'languages_required', 'business_goals',
+    'success_metrics', 'sla_tier', 'profile_status', 'contact_email', 'contact_phone',
+    'industry', 'annual_revenue', 'employee_count', 'profile_created_date', 'last_updated'
+)
+VALUE_ESTIMATE_RESPONSE_FIELDS = (
+    'id', 'tenant_id', 'calculation_date', 'cost_savings', 'user_reach_impact', 'efficiency_gains',
+    'quality_improvements', 'total_value_score', 'calculation_methodology', 'sector_multiplier',
+    'use_case_multiplier', 'confidence_score', 'roi_ratio', 'payback_period_months'
+)
+RECOMMENDATION_RESPONSE_FIELDS = (
+    'recommendation_id', 'tenant_id', 'recommendation_type', 'priority', 'title', 'description',
+    'expected_impact', 'implementation_effort', 'status', 'created_date', 'implemented_date',
+    'confidence_score', 'business_value', 'technical_details', 'sector_context', 'use_case_context'
+)
+
+class DataTransformer:
+    """Data transformation utilities"""
     
-    @staticmethod
-    def recommendation_to_api_response(recommendation: Recommendation) -> Dict[str, Any]:
-        """Transform recommendation to API response format"""
-        return {
-            'recommendation_id': recommendation.recommendation_id,
-            'tenant_id': recommendation.tenant_id,
-            'recommendation_type': recommendation.recommendation_type,
-            'priority': recommendation.priority,
-            'title': recommendation.title,
-            'description': recommendation.description,
-            'expected_impact': recommendation.expected_impact,
-            'implementation_effort': recommendation.implementation_effort,
-            'status': recommendation.status,
-            'created_date': recommendation.created_date.isoformat(),
-            'implemented_date': recommendation.implemented_date.isoformat() if recommendation.implemented_date else None,
-            'confidence_score': recommendation.confidence_score,
-            'business_value': recommendation.business_value,
-            'technical_details': recommendation.technical_details,
-            'sector_context': recommendation.sector_context,
-            'use_case_context': recommendation.use_case_context
-        }
+    __slots__ = ()
+    
+    # API response builders are generated once at import; datetime fields come from each model's _DT_COLS
+    profile_to_api_response = staticmethod(_compile_record_converter(
+        'profile_to_api_response', PROFILE_RESPONSE_FIELDS, CustomerProfile._DT_COLS
+    ))
+    value_estimate_to_api_response = staticmethod(_compile_record_converter(
+        'value_estimate_to_api_response', VALUE_ESTIMATE_RESPONSE_FIELDS, ValueEstimate._DT_COLS
+    ))
+    recommendation_to_api_response = staticmethod(_compile_record_converter(
+        'recommendation_to_api_response', RECOMMENDATION_RESPONSE_FIELDS, Recommendation._DT_COLS
+    ))
+
+# Shared stateless instances; callers should reuse these instead of constructing per request
+data_validator = DataValidator()
+data_transformer = DataTransformer()
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -494,8 +647,7 @@ if __name__ == "__main__":
         'contact_email': 'test@example.com'
     }
     
-    validator = DataValidator()
-    validation_errors = validator.validate_customer_profile(test_profile)
+    validation_errors = data_validator.validate_customer_profile(test_profile)
     
     if validation_errors:
         print("Validation errors:")
@@ -505,8 +657,6 @@ if __name__ == "__main__":
         print("Profile validation passed")
     
     # Test data transformation
-    transformer = DataTransformer()
-    
     # Create sample profile object
     sample_profile = CustomerProfile(
         tenant_id='test_tenant',
@@ -524,6 +674,6 @@ if __name__ == "__main__":
     )
     
     # Transform to API response
-    api_response = transformer.profile_to_api_response(sample_profile)
+    api_response = data_transformer.profile_to_api_response(sample_profile)
     print("\nAPI Response:")
     print(json.dumps(api_response, indent=2))
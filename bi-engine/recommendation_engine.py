@@ -10,22 +10,230 @@ This module provides comprehensive recommendation capabilities including:
 - Integration with alerting system for critical recommendations
 """
 
+import functools
 import json
 import logging
+import time
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Final, List, Mapping, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, fields, replace
 import numpy as np
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 import yaml
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: serialization falls back to the stdlib json path
+    orjson = None
+
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+import _kernels
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from sklearn.ensemble import IsolationForest
+    from sklearn.preprocessing import StandardScaler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Column layout of the metric matrix built by _metrics_to_matrix
+METRIC_FIELDS = ('latency_ms', 'throughput_rps', 'error_rate', 'availability_percent')
+LATENCY, THROUGHPUT, ERROR_RATE, AVAILABILITY = range(len(METRIC_FIELDS))
+
+# Anomaly detection: windows below ANOMALY_FOREST_MIN_SAMPLES use a z-score check, larger ones a
+# median-absolute-deviation pre-filter and, only if that finds outliers, a per-tenant isolation
+# forest. The forest is refit when the window size drifts by ANOMALY_REFIT_DRIFT, when any column
+# mean moves by ANOMALY_REFIT_SHIFT standard deviations of the data it was fit on, or once it is
+# ANOMALY_MODEL_MAX_AGE_SECONDS old
+ANOMALY_MIN_SAMPLES = 10
+ANOMALY_FOREST_MIN_SAMPLES = 256
+ANOMALY_REFIT_DRIFT = 0.25
+ANOMALY_REFIT_SHIFT = 1.0
+ANOMALY_MODEL_MAX_AGE_SECONDS = 3600
+ANOMALY_Z_THRESHOLD = 3.0
+ANOMALY_MAD_THRESHOLD = 6.0
+# Smallest deviation from a column's median that can count as an outlier, in METRIC_FIELDS order.
+# Error rate and availability sit at exactly 0 and 100 most of the time, so their MAD is 0 and
+# any blip would otherwise exceed ANOMALY_MAD_THRESHOLD MADs
+ANOMALY_MIN_DEVIATION = np.array([50.0, 5.0, 0.025, 2.0])
+# A window is anomalous when the forest's decision_function drops below this for some sample.
+# With contamination='auto' the decision is 0.5 minus the anomaly score s from the original
+# paper, so this flags samples with s above 0.7 rather than every sample past the 0.5 offset
+ANOMALY_DECISION_THRESHOLD = -0.2
+ANOMALY_DETECTOR_CACHE_SIZE = 1024
+
+# Dense indexes for the priority multiplier tables compiled from the sector and use case rules
+SECTOR_INDEX = {sector: i for i, sector in enumerate(('government', 'healthcare', 'education', 'private', 'NGO'))}
+USE_CASE_INDEX = {use_case: i for i, use_case in enumerate((
+    'citizen_services', 'patient_communication', 'content_localization',
+    'business_operations', 'community_services'
+))}
+RECOMMENDATION_TYPES = ('performance', 'reliability', 'capacity', 'feature')
+RECOMMENDATION_TYPE_INDEX = {rec_type: i for i, rec_type in enumerate(RECOMMENDATION_TYPES)}
+# Analysis score driving each recommendation type (same order) and the score below which it is emitted
+RECOMMENDATION_SCORE_FIELDS = ('performance_score', 'reliability_score', 'capacity_score', 'utilization_score')
+RECOMMENDATION_SCORE_THRESHOLDS = np.array([70.0, 80.0, 75.0, 60.0])
+MAX_RECOMMENDATIONS = 5
+RECOMMENDATION_ID_PREFIXES = ('perf', 'rel', 'cap', 'feat')
+
+# Template scoring tables: priority points and impact/effort weights by level, and the
+# priority levels in ascending order with the final score at which each one starts
+PRIORITY_POINTS = {'critical': 100, 'high': 75, 'medium': 50}
+PRIORITY_POINTS_DEFAULT = 25
+IMPACT_WEIGHTS = {'high': 0.8, 'medium': 0.5, 'low': 0.2}
+EFFORT_WEIGHTS = {'high': 0.8, 'medium': 0.5, 'low': 0.2}
+PRIORITY_LEVELS = ('low', 'medium', 'high', 'critical')
+PRIORITY_LEVEL_STARTS = np.array([50.0, 75.0, 100.0])
+BUSINESS_VALUE_SECTOR_MULTIPLIERS = {
+    'government': 1.5,
+    'healthcare': 2.0,
+    'education': 1.8,
+    'NGO': 1.3,
+    'private': 1.0
+}
+
+# Alerting thresholds a sector holds its services to
+SectorThresholds = namedtuple('SectorThresholds', 'availability error_rate response_time')
+
+# Sector-specific recommendation rules, built once at import and shared read-only
+SECTOR_RULES: Final[Mapping[str, Dict[str, Any]]] = MappingProxyType({
+    'government': {
+        'priority_multipliers': {
+            'availability': 2.0,      # Critical for public services
+            'compliance': 1.8,        # Important for regulations
+            'cost_efficiency': 1.5,   # Public budget constraints
+            'user_experience': 1.3    # Citizen satisfaction
+        },
+        'critical_thresholds': SectorThresholds(
+            availability=99.5,      # Higher availability required
+            error_rate=0.01,        # Lower error tolerance
+            response_time=2000      # Acceptable response time
+        ),
+        'recommendation_focus': ['reliability', 'compliance', 'availability']
+    },
+    'healthcare': {
+        'priority_multipliers': {
+            'accuracy': 3.0,          # Critical for patient safety
+            'reliability': 2.5,       # Critical for medical services
+            'response_time': 2.0,     # Important for emergency situations
+            'availability': 2.0       # Critical for patient care
+        },
+        'critical_thresholds': SectorThresholds(
+            availability=99.9,      # Very high availability required
+            error_rate=0.005,       # Very low error tolerance
+            response_time=1000      # Fast response required
+        ),
+        'recommendation_focus': ['reliability', 'accuracy', 'response_time']
+    },
+    'education': {
+        'priority_multipliers': {
+            'accessibility': 2.0,     # Important for learning equity
+            'content_quality': 1.8,   # Important for learning outcomes
+            'user_experience': 1.5,   # Important for student engagement
+            'cost_efficiency': 1.3    # Budget considerations
+        },
+        'critical_thresholds': SectorThresholds(
+            availability=98.0,      # Good availability required
+            error_rate=0.02,        # Moderate error tolerance
+            response_time=3000      # Acceptable response time
+        ),
+        'recommendation_focus': ['accessibility', 'content_quality', 'user_experience']
+    },
+    'private': {
+        'priority_multipliers': {
+            'cost_efficiency': 1.8,   # Business cost optimization
+            'user_experience': 1.5,   # Customer satisfaction
+            'reliability': 1.3,       # Service quality
+            'scalability': 1.2        # Business growth
+        },
+        'critical_thresholds': SectorThresholds(
+            availability=99.0,      # Good availability required
+            error_rate=0.03,        # Moderate error tolerance
+            response_time=2500      # Acceptable response time
+        ),
+        'recommendation_focus': ['cost_efficiency', 'scalability', 'user_experience']
+    },
+    'NGO': {
+        'priority_multipliers': {
+            'cost_efficiency': 2.0,   # Limited budget constraints
+            'accessibility': 1.8,     # Mission-driven accessibility
+            'reliability': 1.5,       # Service quality
+            'user_experience': 1.3    # Beneficiary satisfaction
+        },
+        'critical_thresholds': SectorThresholds(
+            availability=97.0,      # Basic availability required
+            error_rate=0.05,        # Higher error tolerance
+            response_time=4000      # Acceptable response time
+        ),
+        'recommendation_focus': ['cost_efficiency', 'accessibility', 'reliability']
+    }
+})
+
+# Use case specific recommendation rules
+USE_CASE_RULES: Final[Mapping[str, Dict[str, Any]]] = MappingProxyType({
+    'citizen_services': {
+        'priority_factors': ['availability', 'compliance', 'user_experience'],
+        'critical_metrics': ['response_time', 'error_rate', 'availability'],
+        'optimization_focus': 'public_service_efficiency'
+    },
+    'patient_communication': {
+        'priority_factors': ['accuracy', 'reliability', 'response_time'],
+        'critical_metrics': ['error_rate', 'availability', 'latency'],
+        'optimization_focus': 'patient_safety'
+    },
+    'content_localization': {
+        'priority_factors': ['content_quality', 'accessibility', 'user_experience'],
+        'critical_metrics': ['translation_accuracy', 'response_time', 'availability'],
+        'optimization_focus': 'learning_effectiveness'
+    },
+    'business_operations': {
+        'priority_factors': ['cost_efficiency', 'scalability', 'reliability'],
+        'critical_metrics': ['throughput', 'error_rate', 'availability'],
+        'optimization_focus': 'operational_efficiency'
+    },
+    'community_services': {
+        'priority_factors': ['accessibility', 'cost_efficiency', 'reliability'],
+        'critical_metrics': ['availability', 'response_time', 'error_rate'],
+        'optimization_focus': 'community_impact'
+    }
+})
+USE_CASE_FOCUS_MULTIPLIER = 1.5
+
+# Per-sample critical checks: (column, worst-case reduction, comparison, threshold, message)
+CRITICAL_CHECKS = (
+    (AVAILABILITY, np.min, np.less, 95, "Low availability: min {value:g}%"),
+    (ERROR_RATE, np.max, np.greater, 0.05, "High error rate: max {value:.3f}"),
+    (LATENCY, np.max, np.greater, 5000, "High latency: max {value:g}ms"),
+    (THROUGHPUT, np.min, np.less, 50, "Low throughput: min {value:g} RPS"),
+)
+
+@functools.cache
+def _get_anomaly_estimators():
+    """Import scikit-learn's IsolationForest and StandardScaler on the first forest fit
+    
+    scikit-learn (and the SciPy modules it pulls in) dominates this module's import time, and
+    most analyses are settled by the z-score or MAD checks without ever needing a forest.
+    """
+    from sklearn.ensemble import IsolationForest
+    from sklearn.preprocessing import StandardScaler
+    return IsolationForest, StandardScaler
+
+def _metrics_to_matrix(qos_metrics: List[Dict[str, Any]]) -> np.ndarray:
+    """Pack metric dicts into an (n, 4) float64 matrix in one pass; missing values become 0"""
+    matrix = np.empty((len(qos_metrics), len(METRIC_FIELDS)), dtype=np.float64)
+    for row, metric in enumerate(qos_metrics):
+        get = metric.get
+        matrix[row] = (get('latency_ms', 0), get('throughput_rps', 0),
+                       get('error_rate', 0), get('availability_percent', 0))
+    return matrix
+
+@dataclass(slots=True)
 class Recommendation:
     """Data model for optimization recommendations"""
     recommendation_id: str
@@ -45,7 +253,7 @@ class Recommendation:
     sector_context: Optional[str] = None
     use_case_context: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QoSAnalysis:
     """Data model for QoS analysis results"""
     tenant_id: str
@@ -60,40 +268,107 @@ class QoSAnalysis:
     critical_issues: List[str]
     optimization_opportunities: List[str]
 
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values neither serializer handles natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def serialize_recommendation(recommendation: Recommendation) -> bytes:
+    """Encode a recommendation as UTF-8 JSON bytes
+    
+    orjson walks the slotted dataclass and its datetimes directly, without the intermediate
+    dict that ``json.dumps(asdict(...))`` builds.
+    """
+    if orjson is not None:
+        return orjson.dumps(recommendation, default=_json_default)
+    return json.dumps(asdict(recommendation), default=_json_default).encode()
+
+def serialize_recommendations(recommendations: List[Recommendation]) -> bytes:
+    """Encode a list of recommendations as one UTF-8 JSON array"""
+    if orjson is not None:
+        return orjson.dumps(recommendations, default=_json_default)
+    return json.dumps([asdict(r) for r in recommendations], default=_json_default).encode()
+
+@functools.cache
+def _recommendation_arrow_schema() -> "pa.Schema":
+    """Arrow schema for Recommendation columns; technical_details is carried as a JSON string"""
+    import pyarrow as pa
+    types = {
+        'created_date': pa.timestamp('us'),
+        'implemented_date': pa.timestamp('us'),
+        'confidence_score': pa.float64(),
+        'business_value': pa.float64(),
+    }
+    return pa.schema([(field.name, types.get(field.name, pa.string())) for field in fields(Recommendation)])
+
+def recommendations_to_arrow(recommendations: List[Recommendation]) -> "pa.RecordBatch":
+    """Pack recommendations into a columnar Arrow RecordBatch
+    
+    Each field becomes one contiguous Arrow column, ready to hand to Parquet, DuckDB or Polars
+    without going through per-row dicts. pyarrow is imported on first use.
+    """
+    import pyarrow as pa
+    schema = _recommendation_arrow_schema()
+    columns = []
+    for field in schema:
+        values = [getattr(r, field.name) for r in recommendations]
+        if field.name == 'technical_details':
+            values = [None if v is None else json.dumps(v, default=_json_default) for v in values]
+        columns.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
 class RecommendationEngine:
     """AI-powered recommendation engine for Bhashini optimization"""
     
     def __init__(self, sector_config_path: str = "config/sector-kpis.yml"):
         self.sector_config_path = Path(sector_config_path)
-        self.sector_config = self._load_sector_config()
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
-        self.scaler = StandardScaler()
+        self.sector_config = self._load_sector_config(str(self.sector_config_path))
+        # Fitted (detector, scaler, window size, monotonic fit time) per tenant, reused across
+        # analyses; LRU-bounded
+        self._if_cache: "OrderedDict[str, Tuple[IsolationForest, StandardScaler, int, float]]" = OrderedDict()
+        
+        # Pay any JIT compilation cost at startup rather than on the first analysis
+        _kernels.prewarm()
         
         # Recommendation templates by type
         self.recommendation_templates = self._load_recommendation_templates()
+        # Per-template Recommendations carrying the static fields; generators clone them
+        self._prototypes = self._build_recommendation_prototypes()
+        # Per-type (priority points, impact weights, effort weights) arrays, one entry per template
+        self._template_scores = self._compile_template_scores()
         
-        # Sector-specific recommendation rules
-        self.sector_rules = self._load_sector_rules()
+        # Sector and use case specific recommendation rules
+        self.sector_rules = SECTOR_RULES
+        self.use_case_rules = USE_CASE_RULES
         
-        # Use case specific rules
-        self.use_case_rules = self._load_use_case_rules()
+        # (sector, recommendation type) and (use case, recommendation type) priority multipliers
+        self._sector_multipliers, self._use_case_multipliers = self._compile_priority_multipliers()
     
-    def _load_sector_config(self) -> Dict[str, Any]:
+    # Config and rule loaders are cached per process and shared read-only by every engine instance
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_sector_config(config_path: str) -> Mapping[str, Any]:
         """Load sector-specific configuration"""
         try:
-            if self.sector_config_path.exists():
-                with open(self.sector_config_path, 'r') as f:
-                    return yaml.safe_load(f)
+            path = Path(config_path)
+            if path.exists():
+                with open(path, 'r') as f:
+                    return MappingProxyType(yaml.load(f, Loader=_YAML_LOADER) or {})
             else:
-                logger.warning(f"Sector config not found at {self.sector_config_path}")
-                return {}
+                logger.warning(f"Sector config not found at {config_path}")
+                return MappingProxyType({})
         except Exception as e:
             logger.error(f"Error loading sector config: {e}")
-            return {}
+            return MappingProxyType({})
     
-    def _load_recommendation_templates(self) -> Dict[str, List[Dict[str, Any]]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_recommendation_templates() -> Mapping[str, List[Dict[str, Any]]]:
         """Load recommendation templates for different types"""
-        return {
+        return MappingProxyType({
             'performance': [
                 {
                     'title': 'Optimize Service Latency',
@@ -191,112 +466,77 @@ class RecommendationEngine:
                     }
                 }
             ]
-        }
+        })
     
-    def _load_sector_rules(self) -> Dict[str, Dict[str, Any]]:
-        """Load sector-specific recommendation rules"""
-        return {
-            'government': {
-                'priority_multipliers': {
-                    'availability': 2.0,      # Critical for public services
-                    'compliance': 1.8,        # Important for regulations
-                    'cost_efficiency': 1.5,   # Public budget constraints
-                    'user_experience': 1.3    # Citizen satisfaction
-                },
-                'critical_thresholds': {
-                    'availability': 99.5,     # Higher availability required
-                    'error_rate': 0.01,       # Lower error tolerance
-                    'response_time': 2000     # Acceptable response time
-                },
-                'recommendation_focus': ['reliability', 'compliance', 'availability']
-            },
-            'healthcare': {
-                'priority_multipliers': {
-                    'accuracy': 3.0,          # Critical for patient safety
-                    'reliability': 2.5,       # Critical for medical services
-                    'response_time': 2.0,     # Important for emergency situations
-                    'availability': 2.0       # Critical for patient care
-                },
-                'critical_thresholds': {
-                    'availability': 99.9,     # Very high availability required
-                    'error_rate': 0.005,      # Very low error tolerance
-                    'response_time': 1000     # Fast response required
-                },
-                'recommendation_focus': ['reliability', 'accuracy', 'response_time']
-            },
-            'education': {
-                'priority_multipliers': {
-                    'accessibility': 2.0,     # Important for learning equity
-                    'content_quality': 1.8,   # Important for learning outcomes
-                    'user_experience': 1.5,   # Important for student engagement
-                    'cost_efficiency': 1.3    # Budget considerations
-                },
-                'critical_thresholds': {
-                    'availability': 98.0,     # Good availability required
-                    'error_rate': 0.02,       # Moderate error tolerance
-                    'response_time': 3000     # Acceptable response time
-                },
-                'recommendation_focus': ['accessibility', 'content_quality', 'user_experience']
-            },
-            'private': {
-                'priority_multipliers': {
-                    'cost_efficiency': 1.8,   # Business cost optimization
-                    'user_experience': 1.5,   # Customer satisfaction
-                    'reliability': 1.3,       # Service quality
-                    'scalability': 1.2        # Business growth
-                },
-                'critical_thresholds': {
-                    'availability': 99.0,     # Good availability required
-                    'error_rate': 0.03,       # Moderate error tolerance
-                    'response_time': 2500     # Acceptable response time
-                },
-                'recommendation_focus': ['cost_efficiency', 'scalability', 'user_experience']
-            },
-            'NGO': {
-                'priority_multipliers': {
-                    'cost_efficiency': 2.0,   # Limited budget constraints
-                    'accessibility': 1.8,     # Mission-driven accessibility
-                    'reliability': 1.5,       # Service quality
-                    'user_experience': 1.3    # Beneficiary satisfaction
-                },
-                'critical_thresholds': {
-                    'availability': 97.0,     # Basic availability required
-                    'error_rate': 0.05,       # Higher error tolerance
-                    'response_time': 4000     # Acceptable response time
-                },
-                'recommendation_focus': ['cost_efficiency', 'accessibility', 'reliability']
-            }
-        }
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_recommendation_prototypes() -> Mapping[str, Tuple[Recommendation, ...]]:
+        """Build one prototype Recommendation per template, in template order
+        
+        Only the per-tenant fields are filled in when a prototype is cloned, so the template
+        strings are shared rather than copied per recommendation. technical_details is a mutable
+        dict, so each clone gets its own copy instead of the cached template's.
+        """
+        templates = RecommendationEngine._load_recommendation_templates()
+        return MappingProxyType({
+            rec_type: tuple(
+                Recommendation(
+                    recommendation_id='',
+                    tenant_id='',
+                    recommendation_type=rec_type,
+                    priority='',
+                    title=template['title'],
+                    description=template['description'],
+                    expected_impact=template['expected_impact'],
+                    implementation_effort=template['implementation_effort'],
+                    status='pending',
+                    created_date=datetime.min,
+                    technical_details=template.get('technical_details')
+                )
+                for template in templates[rec_type]
+            )
+            for rec_type in RECOMMENDATION_TYPES
+        })
     
-    def _load_use_case_rules(self) -> Dict[str, Dict[str, Any]]:
-        """Load use case specific recommendation rules"""
-        return {
-            'citizen_services': {
-                'priority_factors': ['availability', 'compliance', 'user_experience'],
-                'critical_metrics': ['response_time', 'error_rate', 'availability'],
-                'optimization_focus': 'public_service_efficiency'
-            },
-            'patient_communication': {
-                'priority_factors': ['accuracy', 'reliability', 'response_time'],
-                'critical_metrics': ['error_rate', 'availability', 'latency'],
-                'optimization_focus': 'patient_safety'
-            },
-            'content_localization': {
-                'priority_factors': ['content_quality', 'accessibility', 'user_experience'],
-                'critical_metrics': ['translation_accuracy', 'response_time', 'availability'],
-                'optimization_focus': 'learning_effectiveness'
-            },
-            'business_operations': {
-                'priority_factors': ['cost_efficiency', 'scalability', 'reliability'],
-                'critical_metrics': ['throughput', 'error_rate', 'availability'],
-                'optimization_focus': 'operational_efficiency'
-            },
-            'community_services': {
-                'priority_factors': ['accessibility', 'cost_efficiency', 'reliability'],
-                'critical_metrics': ['availability', 'response_time', 'error_rate'],
-                'optimization_focus': 'community_impact'
-            }
-        }
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compile_template_scores() -> Mapping[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Compile each type's template levels into read-only score arrays, in template order"""
+        templates = RecommendationEngine._load_recommendation_templates()
+        compiled = {}
+        for rec_type in RECOMMENDATION_TYPES:
+            arrays = (
+                np.array([PRIORITY_POINTS.get(t['expected_impact'], PRIORITY_POINTS_DEFAULT)
+                          for t in templates[rec_type]], dtype=np.float64),
+                np.array([IMPACT_WEIGHTS.get(t['expected_impact'], 0.5) for t in templates[rec_type]]),
+                np.array([EFFORT_WEIGHTS.get(t['implementation_effort'], 0.5) for t in templates[rec_type]]),
+            )
+            for array in arrays:
+                array.setflags(write=False)
+            compiled[rec_type] = arrays
+        return MappingProxyType(compiled)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compile_priority_multipliers() -> Tuple[np.ndarray, np.ndarray]:
+        """Compile the rule tables into read-only multiplier matrices indexed by recommendation type"""
+        
+        sector_multipliers = np.ones((len(SECTOR_INDEX), len(RECOMMENDATION_TYPES)))
+        for sector, row in SECTOR_INDEX.items():
+            multipliers = SECTOR_RULES[sector].get('priority_multipliers', {})
+            for rec_type, column in RECOMMENDATION_TYPE_INDEX.items():
+                sector_multipliers[row, column] = multipliers.get(rec_type, 1.0)
+        
+        use_case_multipliers = np.ones((len(USE_CASE_INDEX), len(RECOMMENDATION_TYPES)))
+        for use_case, row in USE_CASE_INDEX.items():
+            focus = USE_CASE_RULES[use_case].get('priority_factors', [])
+            for rec_type, column in RECOMMENDATION_TYPE_INDEX.items():
+                if rec_type in focus:
+                    use_case_multipliers[row, column] = USE_CASE_FOCUS_MULTIPLIER
+        
+        sector_multipliers.setflags(write=False)
+        use_case_multipliers.setflags(write=False)
+        return sector_multipliers, use_case_multipliers
     
     def analyze_qos_metrics(self, tenant_id: str, qos_metrics: List[Dict[str, Any]]) -> QoSAnalysis:
         """Analyze QoS metrics and identify optimization opportunities"""
@@ -316,29 +556,26 @@ class RecommendationEngine:
                     optimization_opportunities=[]
                 )
             
-            # Extract metrics for analysis
-            latencies = [m.get('latency_ms', 0) for m in qos_metrics]
-            throughputs = [m.get('throughput_rps', 0) for m in qos_metrics]
-            error_rates = [m.get('error_rate', 0) for m in qos_metrics]
-            availabilities = [m.get('availability_percent', 0) for m in qos_metrics]
+            # Extract metrics once into a matrix shared by every analysis step
+            metrics = _metrics_to_matrix(qos_metrics)
+            means = metrics.mean(axis=0)
             
-            # Calculate performance scores
-            performance_score = self._calculate_performance_score(latencies, throughputs)
-            reliability_score = self._calculate_reliability_score(error_rates, availabilities)
-            capacity_score = self._calculate_capacity_score(throughputs, availabilities)
-            utilization_score = self._calculate_utilization_score(qos_metrics)
+            # Calculate performance, reliability, capacity and utilization scores
+            performance_score, reliability_score, capacity_score, utilization_score = (
+                self._calculate_scores(means).tolist()
+            )
             
             # Detect anomalies
-            anomaly_detected = self._detect_anomalies(qos_metrics)
+            anomaly_detected = self._detect_anomalies(tenant_id, metrics)
             
             # Analyze trends
-            trend_direction = self._analyze_trends(qos_metrics)
+            trend_direction = self._analyze_trends(metrics)
             
             # Identify critical issues
-            critical_issues = self._identify_critical_issues(qos_metrics)
+            critical_issues = self._identify_critical_issues(metrics)
             
             # Identify optimization opportunities
-            optimization_opportunities = self._identify_optimization_opportunities(qos_metrics)
+            optimization_opportunities = self._identify_optimization_opportunities(means)
             
             return QoSAnalysis(
                 tenant_id=tenant_id,
@@ -358,143 +595,114 @@ class RecommendationEngine:
             logger.error(f"Error analyzing QoS metrics: {e}")
             raise
     
-    def _calculate_performance_score(self, latencies: List[float], throughputs: List[float]) -> float:
-        """Calculate performance score based on latency and throughput"""
-        try:
-            if not latencies or not throughputs:
-                return 0.0
-            
-            # Normalize latency (lower is better)
-            avg_latency = np.mean(latencies)
-            latency_score = max(0, 100 - (avg_latency / 50))  # 5s = 0, 0s = 100
-            
-            # Normalize throughput (higher is better)
-            avg_throughput = np.mean(throughputs)
-            throughput_score = min(100, (avg_throughput / 10))  # 1000 RPS = 100
-            
-            # Weighted average
-            performance_score = (latency_score * 0.6 + throughput_score * 0.4)
-            
-            return max(0, min(100, performance_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating performance score: {e}")
-            return 50.0
-    
-    def _calculate_reliability_score(self, error_rates: List[float], availabilities: List[float]) -> float:
-        """Calculate reliability score based on error rates and availability"""
+    def _calculate_scores(self, means: np.ndarray) -> np.ndarray:
+        """Calculate the four 0-100 analysis scores, in RECOMMENDATION_SCORE_FIELDS order, from metric means"""
         try:
-            if not error_rates or not availabilities:
-                return 0.0
-            
-            # Normalize error rate (lower is better)
-            avg_error_rate = np.mean(error_rates)
-            error_score = max(0, 100 - (avg_error_rate * 2000))  # 5% = 0, 0% = 100
+            avg_latency = means[LATENCY]
+            avg_throughput = means[THROUGHPUT]
+            avg_error_rate = means[ERROR_RATE]
+            avg_availability = means[AVAILABILITY]  # Already 0-100
             
-            # Normalize availability (higher is better)
-            avg_availability = np.mean(availabilities)
-            availability_score = avg_availability  # Already 0-100
+            # Performance: latency (lower is better, 5s = 0) and throughput (1000 RPS = 100)
+            latency_score = max(0, 100 - (avg_latency / 50))
+            performance_score = latency_score * 0.6 + min(100, avg_throughput / 10) * 0.4
             
-            # Weighted average
-            reliability_score = (error_score * 0.7 + availability_score * 0.3)
+            # Reliability: error rate (lower is better, 5% = 0) and availability
+            error_score = max(0, 100 - (avg_error_rate * 2000))
+            reliability_score = error_score * 0.7 + avg_availability * 0.3
             
-            return max(0, min(100, reliability_score))
+            # Capacity: throughput (500 RPS = 100) and availability
+            capacity_score = min(100, avg_throughput / 5) * 0.6 + avg_availability * 0.4
             
-        except Exception as e:
-            logger.error(f"Error calculating reliability score: {e}")
-            return 50.0
-    
-    def _calculate_capacity_score(self, throughputs: List[float], availabilities: List[float]) -> float:
-        """Calculate capacity score based on throughput and availability"""
-        try:
-            if not throughputs or not availabilities:
-                return 0.0
-            
-            # Normalize throughput (higher is better)
-            avg_throughput = np.mean(throughputs)
-            throughput_score = min(100, (avg_throughput / 5))  # 500 RPS = 100
-            
-            # Normalize availability (higher is better)
-            avg_availability = np.mean(availabilities)
-            availability_score = avg_availability  # Already 0-100
-            
-            # Weighted average
-            capacity_score = (throughput_score * 0.6 + availability_score * 0.4)
-            
-            return max(0, min(100, capacity_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating capacity score: {e}")
-            return 50.0
-    
-    def _calculate_utilization_score(self, qos_metrics: List[Dict[str, Any]]) -> float:
-        """Calculate utilization score based on resource usage patterns"""
-        try:
-            if not qos_metrics:
-                return 0.0
-            
-            # Calculate utilization based on throughput vs capacity
-            throughputs = [m.get('throughput_rps', 0) for m in qos_metrics]
-            avg_throughput = np.mean(throughputs)
-            
-            # Assume optimal utilization is around 70%
+            # Utilization: proximity to an optimal 70% utilization (350 RPS = 100%)
             optimal_utilization = 70.0
-            current_utilization = min(100, (avg_throughput / 3.5) * 100)  # 350 RPS = 100%
-            
-            # Score based on proximity to optimal utilization
+            current_utilization = min(100, (avg_throughput / 3.5) * 100)
             utilization_score = 100 - abs(current_utilization - optimal_utilization)
             
-            return max(0, min(100, utilization_score))
+            scores = np.array([performance_score, reliability_score, capacity_score, utilization_score],
+                              dtype=np.float64)
+            return np.clip(scores, 0.0, 100.0)
             
         except Exception as e:
-            logger.error(f"Error calculating utilization score: {e}")
-            return 50.0
+            logger.error(f"Error calculating scores: {e}")
+            return np.full(len(RECOMMENDATION_SCORE_FIELDS), 50.0)
     
-    def _detect_anomalies(self, qos_metrics: List[Dict[str, Any]]) -> bool:
-        """Detect anomalies in QoS metrics using isolation forest"""
+    def _detect_anomalies(self, tenant_id: str, metrics: np.ndarray) -> bool:
+        """Detect anomalies in the metric matrix using a cached per-tenant isolation forest"""
         try:
-            if len(qos_metrics) < 10:
+            n = len(metrics)
+            if n < ANOMALY_MIN_SAMPLES:
                 return False
             
-            # Extract numerical features for anomaly detection
-            features = []
-            for metric in qos_metrics:
-                feature_vector = [
-                    metric.get('latency_ms', 0),
-                    metric.get('throughput_rps', 0),
-                    metric.get('error_rate', 0),
-                    metric.get('availability_percent', 0)
-                ]
-                features.append(feature_vector)
-            
-            # Normalize features
-            features_scaled = self.scaler.fit_transform(features)
+            # Small windows: a z-score check is cheaper than growing a forest
+            if n < ANOMALY_FOREST_MIN_SAMPLES:
+                return bool(_kernels.max_abs_zscore(metrics) > ANOMALY_Z_THRESHOLD)
             
-            # Detect anomalies
-            anomaly_labels = self.anomaly_detector.fit_predict(features_scaled)
+            # Windows where every sample sits within a few MADs (or the minimum deviation) of the
+            # median are clean; skip the forest
+            deviations = np.abs(metrics - np.median(metrics, axis=0))
+            limits = np.maximum(ANOMALY_MAD_THRESHOLD * np.median(deviations, axis=0), ANOMALY_MIN_DEVIATION)
+            if (deviations <= limits).all():
+                return False
             
-            # Check if any anomalies were detected
-            anomalies_detected = any(label == -1 for label in anomaly_labels)
+            detector, scaler = self._get_detector(tenant_id, metrics)
+            decisions = detector.decision_function(scaler.transform(metrics))
             
-            return anomalies_detected
+            # Check if any sample is isolated clearly enough to count as an anomaly
+            return bool(decisions.min() < ANOMALY_DECISION_THRESHOLD)
             
         except Exception as e:
             logger.error(f"Error detecting anomalies: {e}")
             return False
     
-    def _analyze_trends(self, qos_metrics: List[Dict[str, Any]]) -> str:
-        """Analyze trends in QoS metrics over time"""
+    def _get_detector(self, tenant_id: str, metrics: np.ndarray) -> Tuple["IsolationForest", "StandardScaler"]:
+        """Return the tenant's fitted (detector, scaler) pair, fitting a fresh one when needed
+        
+        Each tenant gets its own estimators so analyses never refit shared state. A pair is refit
+        when there is no model yet, when the window changed materially (its size drifted or its
+        distribution shifted away from the one the scaler was fit on), or when the model is older
+        than ANOMALY_MODEL_MAX_AGE_SECONDS. The least recently used tenants are evicted beyond
+        ANOMALY_DETECTOR_CACHE_SIZE.
+        """
+        n = len(metrics)
+        now = time.monotonic()
+        cached = self._if_cache.get(tenant_id)
+        if cached is not None:
+            detector, scaler, fitted_n, fitted_at = cached
+            shift = np.abs((metrics.mean(axis=0) - scaler.mean_) / scaler.scale_).max()
+            if (abs(n - fitted_n) <= fitted_n * ANOMALY_REFIT_DRIFT and shift <= ANOMALY_REFIT_SHIFT
+                    and now - fitted_at <= ANOMALY_MODEL_MAX_AGE_SECONDS):
+                self._if_cache.move_to_end(tenant_id)
+                return detector, scaler
+        
+        IsolationForest, StandardScaler = _get_anomaly_estimators()
+        scaler = StandardScaler().fit(metrics)
+        # 50 trees of at most 256 samples over all four metrics; contamination='auto' fixes the
+        # decision offset at the original paper's 0.5 instead of labelling a fixed 10% of every
+        # window. The fit is small enough that joblib workers would only add overhead and
+        # oversubscribe the CPUs shared by the API workers, so it stays single-threaded
+        detector = IsolationForest(
+            n_estimators=50,
+            max_samples=min(ANOMALY_FOREST_MIN_SAMPLES, n),
+            max_features=len(METRIC_FIELDS),
+            contamination='auto',
+            random_state=42
+        ).fit(scaler.transform(metrics))
+        self._if_cache[tenant_id] = (detector, scaler, n, now)
+        self._if_cache.move_to_end(tenant_id)
+        if len(self._if_cache) > ANOMALY_DETECTOR_CACHE_SIZE:
+            self._if_cache.popitem(last=False)
+        return detector, scaler
+    
+    def _analyze_trends(self, metrics: np.ndarray) -> str:
+        """Analyze trends in the metric matrix over time"""
         try:
-            if len(qos_metrics) < 5:
+            if len(metrics) < 5:
                 return 'stable'
             
-            # Extract performance metrics over time
-            latencies = [m.get('latency_ms', 0) for m in qos_metrics]
-            error_rates = [m.get('error_rate', 0) for m in qos_metrics]
-            
             # Calculate trend indicators
-            latency_trend = np.polyfit(range(len(latencies)), latencies, 1)[0]
-            error_trend = np.polyfit(range(len(error_rates)), error_rates, 1)[0]
+            latency_trend = _kernels.trend_slope(metrics[:, LATENCY])
+            error_trend = _kernels.trend_slope(metrics[:, ERROR_RATE])
             
             # Determine overall trend
             if latency_trend < -100 and error_trend < -0.01:
@@ -508,27 +716,26 @@ class RecommendationEngine:
             logger.error(f"Error analyzing trends: {e}")
             return 'stable'
     
-    def _identify_critical_issues(self, qos_metrics: List[Dict[str, Any]]) -> List[str]:
-        """Identify critical issues in QoS metrics"""
+    def _identify_critical_issues(self, metrics: np.ndarray) -> List[str]:
+        """Identify critical issues in the metric matrix, one message per issue type"""
         critical_issues = []
         
         try:
-            for metric in qos_metrics:
-                # Check availability
-                if metric.get('availability_percent', 100) < 95:
-                    critical_issues.append(f"Low availability: {metric.get('availability_percent', 0)}%")
-                
-                # Check error rate
-                if metric.get('error_rate', 0) > 0.05:
-                    critical_issues.append(f"High error rate: {metric.get('error_rate', 0):.3f}")
+            for column, reduce, compare, threshold, message in CRITICAL_CHECKS:
+                values = metrics[:, column]
+                if values.size == 0:
+                    continue
                 
-                # Check response time
-                if metric.get('latency_ms', 0) > 5000:
-                    critical_issues.append(f"High latency: {metric.get('latency_ms', 0)}ms")
+                # A single reduction decides the check; healthy windows never build a mask
+                worst = reduce(values)
+                if not compare(worst, threshold):
+                    continue
                 
-                # Check throughput
-                if metric.get('throughput_rps', 0) < 50:
-                    critical_issues.append(f"Low throughput: {metric.get('throughput_rps', 0)} RPS")
+                issue = message.format(value=worst)
+                breaches = int(np.count_nonzero(compare(values, threshold)))
+                if breaches > 1:
+                    issue += f" ({breaches} of {len(values)} samples)"
+                critical_issues.append(issue)
             
             return critical_issues
             
@@ -536,14 +743,14 @@ class RecommendationEngine:
             logger.error(f"Error identifying critical issues: {e}")
             return ["Unable to analyze critical issues"]
     
-    def _identify_optimization_opportunities(self, qos_metrics: List[Dict[str, Any]]) -> List[str]:
-        """Identify optimization opportunities in QoS metrics"""
+    def _identify_optimization_opportunities(self, means: np.ndarray) -> List[str]:
+        """Identify optimization opportunities from the per-column metric means"""
         opportunities = []
         
         try:
-            avg_latency = np.mean([m.get('latency_ms', 0) for m in qos_metrics])
-            avg_throughput = np.mean([m.get('throughput_rps', 0) for m in qos_metrics])
-            avg_error_rate = np.mean([m.get('error_rate', 0) for m in qos_metrics])
+            avg_latency = means[LATENCY]
+            avg_throughput = means[THROUGHPUT]
+            avg_error_rate = means[ERROR_RATE]
             
             if avg_latency > 2000:
                 opportunities.append("Optimize service latency for better user experience")
@@ -564,45 +771,10 @@ class RecommendationEngine:
                                customer_profile: Dict[str, Any]) -> List[Recommendation]:
         """Generate personalized recommendations based on QoS analysis and customer profile"""
         try:
-            recommendations = []
-            sector = customer_profile.get('sector', 'private')
-            use_case = customer_profile.get('use_case_category', 'business_operations')
-            
-            # Get sector and use case rules
-            sector_rule = self.sector_rules.get(sector, self.sector_rules['private'])
-            use_case_rule = self.use_case_rules.get(use_case, self.use_case_rules['business_operations'])
-            
-            # Generate performance recommendations
-            if qos_analysis.performance_score < 70:
-                recommendations.extend(self._generate_performance_recommendations(
-                    qos_analysis, customer_profile, sector_rule, use_case_rule
-                ))
-            
-            # Generate reliability recommendations
-            if qos_analysis.reliability_score < 80:
-                recommendations.extend(self._generate_reliability_recommendations(
-                    qos_analysis, customer_profile, sector_rule, use_case_rule
-                ))
-            
-            # Generate capacity recommendations
-            if qos_analysis.capacity_score < 75:
-                recommendations.extend(self._generate_capacity_recommendations(
-                    qos_analysis, customer_profile, sector_rule, use_case_rule
-                ))
-            
-            # Generate feature recommendations
-            if qos_analysis.utilization_score < 60:
-                recommendations.extend(self._generate_feature_recommendations(
-                    qos_analysis, customer_profile, sector_rule, use_case_rule
-                ))
-            
-            # Prioritize and score recommendations
-            recommendations = self._prioritize_recommendations(recommendations, sector_rule, use_case_rule)
-            
-            # Limit to top recommendations
-            max_recommendations = 5
-            if len(recommendations) > max_recommendations:
-                recommendations = recommendations[:max_recommendations]
+            scores = np.array([getattr(qos_analysis, field) for field in RECOMMENDATION_SCORE_FIELDS])
+            recommendations = self._build_recommendations(
+                qos_analysis, customer_profile, scores < RECOMMENDATION_SCORE_THRESHOLDS
+            )
             
             logger.info(f"Generated {len(recommendations)} recommendations for tenant {qos_analysis.tenant_id}")
             return recommendations
@@ -611,295 +783,125 @@ class RecommendationEngine:
             logger.error(f"Error generating recommendations: {e}")
             return []
     
-    def _generate_performance_recommendations(self, qos_analysis: QoSAnalysis,
-                                            customer_profile: Dict[str, Any],
-                                            sector_rule: Dict[str, Any],
-                                            use_case_rule: Dict[str, Any]) -> List[Recommendation]:
-        """Generate performance optimization recommendations"""
-        recommendations = []
+    def generate_recommendations_batch(self, analyses: List[QoSAnalysis],
+                                       profiles: List[Dict[str, Any]]) -> List[List[Recommendation]]:
+        """Generate recommendations for many tenants, one list per (analysis, profile) pair
         
+        The four analysis scores of every tenant are stacked into a (T, 4) matrix and compared
+        against the type thresholds in one pass, so templates are only walked for tenants and
+        recommendation types that actually produce output.
+        """
         try:
-            templates = self.recommendation_templates['performance']
-            
-            for template in templates:
-                # Calculate priority based on sector rules
-                priority = self._calculate_priority('performance', template, sector_rule, use_case_rule)
-            
-            # Calculate expected impact
-                impact = self._calculate_impact(qos_analysis.performance_score, template['expected_impact'])
-                
-                # Calculate implementation effort
-                effort = self._calculate_effort(template['implementation_effort'])
-            
-            # Calculate confidence score
-                confidence = self._calculate_confidence(qos_analysis, customer_profile)
-            
-                # Calculate business value
-                business_value = self._calculate_business_value(impact, effort, customer_profile)
-                
-            recommendation = Recommendation(
-                    recommendation_id=f"perf_{qos_analysis.tenant_id}_{len(recommendations)}",
-                    tenant_id=qos_analysis.tenant_id,
-                recommendation_type='performance',
-                priority=priority,
-                title=template['title'],
-                description=template['description'],
-                    expected_impact=template['expected_impact'],
-                implementation_effort=template['implementation_effort'],
-                status='pending',
-                created_date=datetime.now(),
-                    confidence_score=confidence,
-                    business_value=business_value,
-                    technical_details=template.get('technical_details'),
-                    sector_context=customer_profile.get('sector'),
-                    use_case_context=customer_profile.get('use_case_category')
-                )
-                
-                recommendations.append(recommendation)
+            if len(analyses) != len(profiles):
+                raise ValueError(f"Got {len(analyses)} analyses but {len(profiles)} profiles")
+            if not analyses:
+                return []
+            
+            scores = np.array([
+                [getattr(analysis, field) for field in RECOMMENDATION_SCORE_FIELDS]
+                for analysis in analyses
+            ], dtype=np.float64)
+            needed = scores < RECOMMENDATION_SCORE_THRESHOLDS
+            
+            results = []
+            for analysis, profile, row in zip(analyses, profiles, needed):
+                if row.any():
+                    results.append(self._build_recommendations(analysis, profile, row))
+                else:
+                    results.append([])
             
-            return recommendations
+            logger.info(f"Generated {sum(map(len, results))} recommendations for {len(analyses)} tenants")
+            return results
             
         except Exception as e:
-            logger.error(f"Error generating performance recommendations: {e}")
-            return []
+            logger.error(f"Error generating recommendations batch: {e}")
+            return [[] for _ in analyses]
     
-    def _generate_reliability_recommendations(self, qos_analysis: QoSAnalysis,
-                                            customer_profile: Dict[str, Any],
-                                            sector_rule: Dict[str, Any],
-                                            use_case_rule: Dict[str, Any]) -> List[Recommendation]:
-        """Generate reliability improvement recommendations"""
-        recommendations = []
+    def _build_recommendations(self, qos_analysis: QoSAnalysis, customer_profile: Dict[str, Any],
+                               needed: np.ndarray) -> List[Recommendation]:
+        """Generate, prioritize and trim recommendations for the types flagged in ``needed``"""
+        sector = customer_profile.get('sector', 'private')
+        use_case = customer_profile.get('use_case_category', 'business_operations')
         
-        try:
-            templates = self.recommendation_templates['reliability']
-            
-            for template in templates:
-                # Calculate priority based on sector rules
-                priority = self._calculate_priority('reliability', template, sector_rule, use_case_rule)
-            
-            # Calculate expected impact
-                impact = self._calculate_impact(qos_analysis.reliability_score, template['expected_impact'])
-                
-                # Calculate implementation effort
-                effort = self._calculate_effort(template['implementation_effort'])
-            
-            # Calculate confidence score
-                confidence = self._calculate_confidence(qos_analysis, customer_profile)
-            
-                # Calculate business value
-                business_value = self._calculate_business_value(impact, effort, customer_profile)
-                
-            recommendation = Recommendation(
-                    recommendation_id=f"rel_{qos_analysis.tenant_id}_{len(recommendations)}",
-                    tenant_id=qos_analysis.tenant_id,
-                recommendation_type='reliability',
-                priority=priority,
-                title=template['title'],
-                description=template['description'],
-                    expected_impact=template['expected_impact'],
-                implementation_effort=template['implementation_effort'],
-                status='pending',
-                created_date=datetime.now(),
-                    confidence_score=confidence,
-                    business_value=business_value,
-                    technical_details=template.get('technical_details'),
-                    sector_context=customer_profile.get('sector'),
-                    use_case_context=customer_profile.get('use_case_category')
-                )
-                
-                recommendations.append(recommendation)
-            
-            return recommendations
-            
-        except Exception as e:
-            logger.error(f"Error generating reliability recommendations: {e}")
-            return []
-    
-    def _generate_capacity_recommendations(self, qos_analysis: QoSAnalysis,
-                                         customer_profile: Dict[str, Any],
-                                         sector_rule: Dict[str, Any],
-                                         use_case_rule: Dict[str, Any]) -> List[Recommendation]:
-        """Generate capacity planning recommendations"""
-        recommendations = []
+        # Get sector and use case rules
+        sector_rule = self.sector_rules.get(sector, self.sector_rules['private'])
+        use_case_rule = self.use_case_rules.get(use_case, self.use_case_rules['business_operations'])
+        
+        # Combined priority multiplier per recommendation type for this sector and use case
+        sector_idx = SECTOR_INDEX.get(sector, SECTOR_INDEX['private'])
+        use_case_idx = USE_CASE_INDEX.get(use_case, USE_CASE_INDEX['business_operations'])
+        type_multipliers = self._sector_multipliers[sector_idx] * self._use_case_multipliers[use_case_idx]
+        
+        # Template-independent inputs, computed once for every type
+        confidence = self._calculate_confidence(qos_analysis, customer_profile)
+        sector_value = BUSINESS_VALUE_SECTOR_MULTIPLIERS.get(customer_profile.get('sector', 'private'), 1.0)
         
-        try:
-            templates = self.recommendation_templates['capacity']
-            
-            for template in templates:
-                # Calculate priority based on sector rules
-                priority = self._calculate_priority('capacity', template, sector_rule, use_case_rule)
-            
-            # Calculate expected impact
-                impact = self._calculate_impact(qos_analysis.capacity_score, template['expected_impact'])
-                
-                # Calculate implementation effort
-                effort = self._calculate_effort(template['implementation_effort'])
-            
-            # Calculate confidence score
-                confidence = self._calculate_confidence(qos_analysis, customer_profile)
-            
-                # Calculate business value
-                business_value = self._calculate_business_value(impact, effort, customer_profile)
-                
-            recommendation = Recommendation(
-                    recommendation_id=f"cap_{qos_analysis.tenant_id}_{len(recommendations)}",
-                    tenant_id=qos_analysis.tenant_id,
-                recommendation_type='capacity',
-                title=template['title'],
-                description=template['description'],
-                    expected_impact=template['expected_impact'],
-                implementation_effort=template['implementation_effort'],
-                status='pending',
-                created_date=datetime.now(),
-                    priority=priority,
-                    confidence_score=confidence,
-                    business_value=business_value,
-                    technical_details=template.get('technical_details'),
-                    sector_context=customer_profile.get('sector'),
-                    use_case_context=customer_profile.get('use_case_category')
-                )
-                
-                recommendations.append(recommendation)
-            
-            return recommendations
-            
-        except Exception as e:
-            logger.error(f"Error generating capacity recommendations: {e}")
-            return []
-    
-    def _generate_feature_recommendations(self, qos_analysis: QoSAnalysis,
-                                        customer_profile: Dict[str, Any],
-                                        sector_rule: Dict[str, Any],
-                                        use_case_rule: Dict[str, Any]) -> List[Recommendation]:
-        """Generate feature adoption recommendations"""
         recommendations = []
+        for type_idx in np.flatnonzero(needed):
+            recommendations.extend(self._generate_type_recommendations(
+                int(type_idx), qos_analysis, customer_profile, type_multipliers, confidence, sector_value
+            ))
         
+        # Prioritize and score recommendations
+        recommendations = self._prioritize_recommendations(recommendations, sector_rule, use_case_rule)
+        
+        # Limit to top recommendations
+        return recommendations[:MAX_RECOMMENDATIONS]
+    
+    def _generate_type_recommendations(self, type_idx: int, qos_analysis: QoSAnalysis,
+                                       customer_profile: Dict[str, Any], type_multipliers: np.ndarray,
+                                       confidence: float, sector_value: float) -> List[Recommendation]:
+        """Generate one recommendation per template of a type, scoring all templates at once"""
+        rec_type = RECOMMENDATION_TYPES[type_idx]
         try:
-            templates = self.recommendation_templates['feature']
-            
-            for template in templates:
-                # Calculate priority based on sector rules
-                priority = self._calculate_priority('feature', template, sector_rule, use_case_rule)
-            
-            # Calculate expected impact
-                impact = self._calculate_impact(qos_analysis.utilization_score, template['expected_impact'])
-                
-                # Calculate implementation effort
-                effort = self._calculate_effort(template['implementation_effort'])
-            
-            # Calculate confidence score
-                confidence = self._calculate_confidence(qos_analysis, customer_profile)
-            
-                # Calculate business value
-                business_value = self._calculate_business_value(impact, effort, customer_profile)
-                
-            recommendation = Recommendation(
-                    recommendation_id=f"feat_{qos_analysis.tenant_id}_{len(recommendations)}",
+            priority_points, impact_weights, effort_weights = self._template_scores[rec_type]
+            
+            # Priority from template impact, scaled by the sector and use case multipliers
+            final_scores = priority_points * type_multipliers[type_idx]
+            priority_levels = np.searchsorted(PRIORITY_LEVEL_STARTS, final_scores, side='right')
+            
+            # Expected impact, adjusted for how poorly the driving score currently looks
+            impacts = impact_weights * self._impact_factor(getattr(qos_analysis, RECOMMENDATION_SCORE_FIELDS[type_idx]))
+            
+            # Business value: higher impact and lower effort score higher, scaled to 0-100
+            business_values = np.clip(impacts * (1 - effort_weights) * sector_value * 100, 0, 100)
+            
+            prefix = RECOMMENDATION_ID_PREFIXES[type_idx]
+            created_date = datetime.now()
+            sector = customer_profile.get('sector')
+            use_case = customer_profile.get('use_case_category')
+            return [
+                replace(
+                    prototype,
+                    recommendation_id=f"{prefix}_{qos_analysis.tenant_id}_{i}",
                     tenant_id=qos_analysis.tenant_id,
-                recommendation_type='feature',
-                priority=priority,
-                title=template['title'],
-                description=template['description'],
-                    expected_impact=template['expected_impact'],
-                implementation_effort=template['implementation_effort'],
-                status='pending',
-                created_date=datetime.now(),
+                    priority=PRIORITY_LEVELS[level],
+                    created_date=created_date,
+                    technical_details=(None if prototype.technical_details is None
+                                       else dict(prototype.technical_details)),
                     confidence_score=confidence,
                     business_value=business_value,
-                    technical_details=template.get('technical_details'),
-                    sector_context=customer_profile.get('sector'),
-                    use_case_context=customer_profile.get('use_case_category')
+                    sector_context=sector,
+                    use_case_context=use_case
                 )
-                
-                recommendations.append(recommendation)
-            
-            return recommendations
+                for i, (prototype, level, business_value) in enumerate(zip(
+                    self._prototypes[rec_type], priority_levels.tolist(), business_values.tolist()
+                ))
+            ]
             
         except Exception as e:
-            logger.error(f"Error generating feature recommendations: {e}")
+            logger.error(f"Error generating {rec_type} recommendations: {e}")
             return []
     
-    def _calculate_priority(self, rec_type: str, template: Dict[str, Any],
-                           sector_rule: Dict[str, Any], use_case_rule: Dict[str, Any]) -> str:
-        """Calculate recommendation priority based on sector and use case rules"""
-        try:
-            # Base priority from template
-            base_priority = template['expected_impact']
-            
-            # Apply sector multipliers
-            sector_multiplier = 1.0
-            if rec_type in sector_rule.get('priority_multipliers', {}):
-                sector_multiplier = sector_rule['priority_multipliers'][rec_type]
-            
-            # Apply use case focus
-            use_case_focus = use_case_rule.get('priority_factors', [])
-            use_case_multiplier = 1.5 if rec_type in use_case_focus else 1.0
-            
-            # Calculate final priority
-            priority_score = 0
-            if base_priority == 'critical':
-                priority_score = 100
-            elif base_priority == 'high':
-                priority_score = 75
-            elif base_priority == 'medium':
-                priority_score = 50
-            else:
-                priority_score = 25
-            
-            # Apply multipliers
-            final_score = priority_score * sector_multiplier * use_case_multiplier
-            
-            # Convert to priority string
-            if final_score >= 100:
-                return 'critical'
-            elif final_score >= 75:
-                return 'high'
-            elif final_score >= 50:
-                return 'medium'
-            else:
-                return 'low'
-                
-        except Exception as e:
-            logger.error(f"Error calculating priority: {e}")
-            return 'medium'
-    
-    def _calculate_impact(self, current_score: float, expected_impact: str) -> float:
-        """Calculate expected impact score"""
-        try:
-            impact_scores = {
-                'high': 0.8,
-                'medium': 0.5,
-                'low': 0.2
-            }
-            
-            base_impact = impact_scores.get(expected_impact, 0.5)
-            
-            # Adjust impact based on current performance
-            if current_score < 50:
-                return base_impact * 1.5  # Higher impact for poor performance
-            elif current_score < 75:
-                return base_impact * 1.2  # Moderate impact for average performance
-                else:
-                return base_impact * 0.8  # Lower impact for good performance
-            
-        except Exception as e:
-            logger.error(f"Error calculating impact: {e}")
-            return 0.5
-    
-    def _calculate_effort(self, implementation_effort: str) -> float:
-        """Calculate implementation effort score"""
-        try:
-            effort_scores = {
-                'high': 0.8,
-                'medium': 0.5,
-                'low': 0.2
-            }
-            
-            return effort_scores.get(implementation_effort, 0.5)
-                
-        except Exception as e:
-            logger.error(f"Error calculating effort: {e}")
-            return 0.5
+    @staticmethod
+    def _impact_factor(current_score: float) -> float:
+        """Impact adjustment for the current score: poor performance leaves the most to gain"""
+        if current_score < 50:
+            return 1.5
+        elif current_score < 75:
+            return 1.2
+        else:
+            return 0.8
     
     def _calculate_confidence(self, qos_analysis: QoSAnalysis, customer_profile: Dict[str, Any]) -> float:
         """Calculate confidence score for recommendations"""
@@ -925,34 +927,6 @@ class RecommendationEngine:
             logger.error(f"Error calculating confidence: {e}")
             return 50.0
     
-    def _calculate_business_value(self, impact: float, effort: float, 
-                                customer_profile: Dict[str, Any]) -> float:
-        """Calculate business value score for recommendations"""
-        try:
-            # Base value calculation
-            base_value = impact * (1 - effort)  # Higher impact, lower effort = higher value
-            
-            # Apply sector multiplier
-            sector = customer_profile.get('sector', 'private')
-            sector_multipliers = {
-                'government': 1.5,
-                'healthcare': 2.0,
-                'education': 1.8,
-                'NGO': 1.3,
-                'private': 1.0
-            }
-            
-            sector_multiplier = sector_multipliers.get(sector, 1.0)
-            
-            # Calculate final business value
-            business_value = base_value * sector_multiplier * 100  # Scale to 0-100
-            
-            return max(0, min(100, business_value))
-            
-        except Exception as e:
-            logger.error(f"Error calculating business value: {e}")
-            return 50.0
-    
     def _prioritize_recommendations(self, recommendations: List[Recommendation],
                                   sector_rule: Dict[str, Any], use_case_rule: Dict[str, Any]) -> List[Recommendation]:
         """Prioritize recommendations based on business value and implementation effort"""
@@ -13,8 +13,9 @@ This module provides comprehensive business value estimation capabilities includ
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Union
+from collections.abc import Mapping
+from dataclasses import dataclass, asdict, replace
 import numpy as np
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
@@ -42,7 +43,7 @@ class ValueMetrics:
     roi_ratio: float  # Return on investment ratio
     payback_period_months: float  # Time to recover investment
 
-@dataclass
+@dataclass(slots=True)
 class QoSMetrics:
     """Data model for QoS metrics used in value calculation"""
     tenant_id: str
@@ -54,6 +55,43 @@ class QoSMetrics:
     availability_percent: float
     response_time_p95: float
 
+# Demo QoS metrics shared by every caller; only tenant_id is rewritten per use
+SAMPLE_QOS_METRICS: Tuple[QoSMetrics, ...] = (
+    QoSMetrics(
+        tenant_id='sample',
+        timestamp=datetime.now(),
+        service_type='translation',
+        latency_ms=1500,
+        throughput_rps=200,
+        error_rate=0.02,
+        availability_percent=99.5,
+        response_time_p95=2500
+    ),
+    QoSMetrics(
+        tenant_id='sample',
+        timestamp=datetime.now(),
+        service_type='tts',
+        latency_ms=800,
+        throughput_rps=150,
+        error_rate=0.01,
+        availability_percent=99.8,
+        response_time_p95=1200
+    ),
+)
+
+def sample_qos_metrics(tenant_id: str) -> List[QoSMetrics]:
+    """Demo QoS metrics for a tenant, copied from the shared module-level samples"""
+    return [replace(metric, tenant_id=tenant_id) for metric in SAMPLE_QOS_METRICS]
+
+# Profile fields the estimator reads; everything else on a profile is ignored
+PROFILE_FIELDS = ('tenant_id', 'sector', 'use_case_category', 'target_user_base', 'sla_tier')
+
+def _profile_view(customer_profile: Union[Mapping, Any]) -> Mapping:
+    """Accept a profile dict or a CustomerProfile object without copying every attribute"""
+    if isinstance(customer_profile, Mapping):
+        return customer_profile
+    return {field: getattr(customer_profile, field, None) for field in PROFILE_FIELDS}
+
 class ValueEstimator:
     """AI-powered value estimation engine"""
     
@@ -108,10 +146,11 @@ class ValueEstimator:
             logger.error(f"Error initializing ML model: {e}")
             self.ml_model = None
     
-    def calculate_customer_value(self, customer_profile: Dict[str, Any], 
+    def calculate_customer_value(self, customer_profile: Union[Dict[str, Any], Any], 
                                qos_metrics: List[QoSMetrics]) -> ValueMetrics:
-        """Calculate comprehensive business value for a customer"""
+        """Calculate comprehensive business value for a customer (profile dict or CustomerProfile)"""
         try:
+            customer_profile = _profile_view(customer_profile)
             tenant_id = customer_profile['tenant_id']
             sector = customer_profile['sector']
             use_case = customer_profile['use_case_category']
@@ -192,7 +231,7 @@ class ValueEstimator:
             efficiency_multiplier = self._calculate_efficiency_multiplier(qos_metrics)
             adjusted_savings = annual_savings * efficiency_multiplier
             
-            logger.info(f"Cost savings calculated: ${adjusted_savings:,.2f} annually")
+            logger.debug("Cost savings calculated: $%.2f annually", adjusted_savings)
             return adjusted_savings
             
         except Exception as e:
@@ -229,7 +268,7 @@ class ValueEstimator:
             effective_reach = int(target_users * availability_multiplier * 
                                 quality_multiplier * sector_multiplier)
             
-            logger.info(f"User reach impact calculated: {effective_reach:,} users")
+            logger.debug("User reach impact calculated: %d users", effective_reach)
             return effective_reach
             
         except Exception as e:
@@ -264,7 +303,7 @@ class ValueEstimator:
                 availability_improvement * 0.3
             ) * 100  # Convert to percentage
             
-            logger.info(f"Efficiency gains calculated: {efficiency_gains:.1f}%")
+            logger.debug("Efficiency gains calculated: %.1f%%", efficiency_gains)
             return efficiency_gains
             
         except Exception as e:
@@ -293,7 +332,7 @@ class ValueEstimator:
                 response_consistency * 0.4
             ) * 100  # Convert to percentage
             
-            logger.info(f"Quality improvements calculated: {quality_score:.1f}%")
+            logger.debug("Quality improvements calculated: %.1f%%", quality_score)
             return quality_score
             
         except Exception as e:
@@ -357,7 +396,7 @@ class ValueEstimator:
             # Normalize to 0-100 range
             final_score = min(100, max(0, adjusted_score))
             
-            logger.info(f"Total value score calculated: {final_score:.1f}/100")
+            logger.debug("Total value score calculated: %.1f/100", final_score)
             return final_score
             
         except Exception as e:
@@ -386,7 +425,7 @@ class ValueEstimator:
             else:
                 roi = 0.0
             
-            logger.info(f"ROI ratio calculated: {roi:.2f}x")
+            logger.debug("ROI ratio calculated: %.2fx", roi)
             return roi
             
         except Exception as e:
@@ -418,7 +457,7 @@ class ValueEstimator:
             # Cap at reasonable range
             payback_months = min(payback_months, 60)  # Max 5 years
             
-            logger.info(f"Payback period calculated: {payback_months:.1f} months")
+            logger.debug("Payback period calculated: %.1f months", payback_months)
             return payback_months
                 
         except Exception as e:
@@ -455,7 +494,7 @@ class ValueEstimator:
             # Ensure confidence is within 0-100 range
             confidence = max(0, min(100, confidence))
             
-            logger.info(f"Confidence score calculated: {confidence:.1f}%")
+            logger.debug("Confidence score calculated: %.1f%%", confidence)
             return confidence
                 
         except Exception as e:
@@ -463,9 +502,10 @@ class ValueEstimator:
             return 50.0
     
     def generate_value_report(self, value_metrics: ValueMetrics, 
-                            customer_profile: Dict[str, Any]) -> Dict[str, Any]:
+                            customer_profile: Union[Dict[str, Any], Any]) -> Dict[str, Any]:
         """Generate comprehensive value impact report"""
         try:
+            customer_profile = _profile_view(customer_profile)
             report = {
                 'executive_summary': {
                     'total_annual_value': f"${value_metrics.cost_savings:,.2f}",
@@ -527,8 +567,7 @@ class ValueEstimator:
             # Efficiency recommendations
             if value_metrics.efficiency_gains < 20:
                 recommendations.append("Optimize service performance to improve efficiency gains")
-        
-        try:
+            
             # Quality recommendations
             if value_metrics.quality_improvements < 30:
                 recommendations.append("Implement quality improvement measures for better user satisfaction")
@@ -540,8 +579,8 @@ class ValueEstimator:
             # Payback period recommendations
             if value_metrics.payback_period_months > 24:
                 recommendations.append("Consider phased implementation to reduce initial investment")
-        
-        return recommendations
+            
+            return recommendations
             
         except Exception as e:
             logger.error(f"Error generating recommendations: {e}")
@@ -562,28 +601,7 @@ if __name__ == "__main__":
     }
     
     # Sample QoS metrics
-    qos_metrics = [
-        QoSMetrics(
-            tenant_id='gov_digital_india',
-            timestamp=datetime.now(),
-            service_type='translation',
-            latency_ms=1500,
-            throughput_rps=200,
-            error_rate=0.02,
-            availability_percent=99.5,
-            response_time_p95=2500
-        ),
-        QoSMetrics(
-            tenant_id='gov_digital_india',
-            timestamp=datetime.now(),
-            service_type='tts',
-            latency_ms=800,
-            throughput_rps=150,
-            error_rate=0.01,
-            availability_percent=99.8,
-            response_time_p95=1200
-        )
-    ]
+    qos_metrics = sample_qos_metrics('gov_digital_india')
     
     # Calculate value
     try:
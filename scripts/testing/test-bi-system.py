@@ -275,38 +275,46 @@ class TestRecommendationEngine(unittest.TestCase):
             "optimization_opportunities": ["cache_optimization"]
         }
     
-    def test_performance_score_calculation(self):
-        """Test performance score calculation"""
-        score = self.engine._calculate_performance_score([])
-        self.assertIsInstance(score, float)
-        self.assertGreaterEqual(score, 0)
-        self.assertLessEqual(score, 100)
-    
-    def test_reliability_score_calculation(self):
-        """Test reliability score calculation"""
-        score = self.engine._calculate_reliability_score([])
-        self.assertIsInstance(score, float)
-        self.assertGreaterEqual(score, 0)
-        self.assertLessEqual(score, 100)
-    
-    def test_capacity_score_calculation(self):
-        """Test capacity score calculation"""
-        score = self.engine._calculate_capacity_score([])
-        self.assertIsInstance(score, float)
-        self.assertGreaterEqual(score, 0)
-        self.assertLessEqual(score, 100)
-    
-    def test_utilization_score_calculation(self):
-        """Test utilization score calculation"""
-        score = self.engine._calculate_utilization_score([])
-        self.assertIsInstance(score, float)
-        self.assertGreaterEqual(score, 0)
-        self.assertLessEqual(score, 100)
+    def test_score_calculation(self):
+        """Test the fused performance, reliability, capacity and utilization scores"""
+        import numpy as np
+        
+        # Means in METRIC_FIELDS order: latency_ms, throughput_rps, error_rate, availability_percent
+        scores = self.engine._calculate_scores(np.array([1500.0, 250.0, 0.01, 99.5]))
+        self.assertEqual(len(scores), 4)
+        for score in scores.tolist():
+            self.assertIsInstance(score, float)
+            self.assertGreaterEqual(score, 0)
+            self.assertLessEqual(score, 100)
+        
+        # Extreme means are clamped into 0-100
+        scores = self.engine._calculate_scores(np.array([100000.0, 100000.0, 1.0, 0.0]))
+        self.assertTrue(((scores >= 0) & (scores <= 100)).all())
+    
+    def test_qos_metrics_analysis_scores(self):
+        """Test that QoS analysis reports the four scores within 0-100"""
+        qos_metrics = [
+            {"service_type": "translation", "latency_ms": 1200 + i * 10, "throughput_rps": 300,
+             "error_rate": 0.01, "availability_percent": 99.9}
+            for i in range(10)
+        ]
+        analysis = self.engine.analyze_qos_metrics("test-001", qos_metrics)
+        for score in (analysis.performance_score, analysis.reliability_score,
+                      analysis.capacity_score, analysis.utilization_score):
+            self.assertIsInstance(score, float)
+            self.assertGreaterEqual(score, 0)
+            self.assertLessEqual(score, 100)
+        
+        empty = self.engine.analyze_qos_metrics("test-001", [])
+        self.assertEqual(empty.performance_score, 0.0)
     
     def test_anomaly_detection(self):
         """Test anomaly detection functionality"""
-        anomalies = self.engine._detect_anomalies([])
-        self.assertIsInstance(anomalies, list)
+        import numpy as np
+        
+        anomaly_detected = self.engine._detect_anomalies("test-001", np.empty((0, 4)))
+        self.assertIsInstance(anomaly_detected, bool)
+        self.assertFalse(anomaly_detected)
     
     def test_trend_analysis(self):
         """Test trend analysis functionality"""
@@ -344,6 +352,23 @@ class TestRecommendationEngine(unittest.TestCase):
             self.assertIsInstance(rec.implementation_effort, str)
             self.assertIsInstance(rec.business_value, float)
             self.assertIsInstance(rec.confidence_score, float)
+    
+    def test_recommendations_own_their_technical_details(self):
+        """Test that mutating one recommendation's details leaves later tenants untouched"""
+        qos_metrics = [
+            {"latency_ms": 4000, "throughput_rps": 100, "error_rate": 0.04, "availability_percent": 97.0}
+            for _ in range(10)
+        ]
+        analysis = self.engine.analyze_qos_metrics("test-001", qos_metrics)
+        first = self.engine.generate_recommendations(analysis, self.sample_profile)
+        self.assertTrue(first)
+        expected = [dict(rec.technical_details) for rec in first]
+        
+        for rec in first:
+            rec.technical_details["mutated"] = True
+        
+        second = self.engine.generate_recommendations(analysis, self.sample_profile)
+        self.assertEqual([rec.technical_details for rec in second], expected)
 
 
 class TestDataModels(unittest.TestCase):
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for QoS anomaly detection in the recommendation engine
+
+Windows of ANOMALY_FOREST_MIN_SAMPLES or more go through a median-absolute-deviation
+pre-filter, and only windows with outliers reach the per-tenant isolation forest, which is
+cached and refit when the window changes materially or the model grows old.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+# Add the bi-engine directory to the path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "bi-engine"))
+
+from recommendation_engine import ANOMALY_MODEL_MAX_AGE_SECONDS, RecommendationEngine
+
+WINDOW = 300
+
+
+def _clean_window(rng, n=WINDOW):
+    """Healthy traffic: steady latency and throughput, error rate mostly 0 and availability mostly 100"""
+    metrics = np.empty((n, 4))
+    metrics[:, 0] = rng.uniform(1100, 1300, n)
+    metrics[:, 1] = rng.uniform(280, 320, n)
+    metrics[:, 2] = 0.0
+    metrics[:, 3] = 100.0
+    # About 5% of samples see a few failed requests or a short availability dip
+    errors = rng.random(n) < 0.05
+    metrics[errors, 2] = rng.uniform(0.001, 0.02, errors.sum())
+    dips = rng.random(n) < 0.05
+    metrics[dips, 3] = rng.uniform(98.5, 99.99, dips.sum())
+    return metrics
+
+
+def _gaussian_window(rng, n=WINDOW):
+    """Normally distributed metrics with one 4.5 sigma latency sample, enough to pass the pre-filter"""
+    metrics = np.empty((n, 4))
+    metrics[:, 0] = rng.normal(1200, 100, n)
+    metrics[:, 1] = rng.normal(300, 20, n)
+    metrics[:, 2] = np.abs(rng.normal(0.01, 0.002, n))
+    metrics[:, 3] = rng.normal(99.5, 0.1, n)
+    metrics[0, 0] = 1200 + 4.5 * 100
+    return metrics
+
+
+def _spiky_window(rng, n=WINDOW):
+    """A clean window with a short outage: latency and error spikes on a few samples"""
+    metrics = _clean_window(rng, n)
+    spikes = rng.choice(n, 3, replace=False)
+    metrics[spikes, 0] = 6000.0
+    metrics[spikes, 2] = 0.3
+    return metrics
+
+
+class TestAnomalyDetection(unittest.TestCase):
+    """Test cases for the MAD pre-filter and forest decision"""
+
+    def setUp(self):
+        self.engine = RecommendationEngine(sector_config_path="/nonexistent/sector-kpis.yml")
+
+    def test_clean_windows_skip_the_forest(self):
+        with patch.object(self.engine, "_get_detector", side_effect=AssertionError("forest fitted")):
+            for seed in range(20):
+                with self.subTest(seed=seed):
+                    self.assertFalse(self.engine._detect_anomalies("tenant", _clean_window(np.random.default_rng(seed))))
+
+    def test_sub_threshold_blip_in_constant_column(self):
+        metrics = np.tile([1000.0, 300.0, 0.0, 100.0], (WINDOW, 1))
+        metrics[5, 0] += 0.5
+        metrics[9, 2] = 1e-9
+        with patch.object(self.engine, "_get_detector", side_effect=AssertionError("forest fitted")):
+            self.assertFalse(self.engine._detect_anomalies("tenant", metrics))
+
+    def test_clean_windows_reaching_the_forest_not_flagged(self):
+        # The forest labels some sample -1 in almost every window; only clearly isolated samples count
+        with patch.object(self.engine, "_get_detector", wraps=self.engine._get_detector) as get_detector:
+            for seed in range(10):
+                with self.subTest(seed=seed):
+                    self.assertFalse(self.engine._detect_anomalies(f"tenant_{seed}", _gaussian_window(np.random.default_rng(seed))))
+            self.assertEqual(get_detector.call_count, 10)
+
+    def test_forest_fit_single_threaded(self):
+        detector, _ = self.engine._get_detector("tenant", _spiky_window(np.random.default_rng(0)))
+        self.assertIsNone(detector.n_jobs)
+
+    def test_spiky_windows_flagged(self):
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                self.assertTrue(self.engine._detect_anomalies(f"tenant_{seed}", _spiky_window(np.random.default_rng(seed))))
+
+    def test_spike_in_constant_column_flagged(self):
+        metrics = np.tile([1000.0, 300.0, 0.0, 100.0], (WINDOW, 1))
+        metrics[7, 0] = 5000.0
+        metrics[9, 2] = 0.3
+        self.assertTrue(self.engine._detect_anomalies("tenant", metrics))
+
+
+class TestDetectorCache(unittest.TestCase):
+    """Test cases for reusing and refitting the per-tenant forest"""
+
+    def setUp(self):
+        self.engine = RecommendationEngine(sector_config_path="/nonexistent/sector-kpis.yml")
+        self.window = _gaussian_window(np.random.default_rng(0))
+
+    def test_similar_window_reuses_detector(self):
+        detector, scaler = self.engine._get_detector("tenant", self.window)
+        next_window = _gaussian_window(np.random.default_rng(1))[:280]
+        self.assertEqual(self.engine._get_detector("tenant", next_window), (detector, scaler))
+
+    def test_shifted_window_refits(self):
+        detector, scaler = self.engine._get_detector("tenant", self.window)
+        shifted = self.window.copy()
+        shifted[:, 0] += 1000.0
+        new_detector, new_scaler = self.engine._get_detector("tenant", shifted)
+        self.assertIsNot(new_detector, detector)
+        self.assertAlmostEqual(new_scaler.mean_[0], shifted[:, 0].mean())
+
+    def test_resized_window_refits(self):
+        detector, _ = self.engine._get_detector("tenant", self.window)
+        self.assertIsNot(self.engine._get_detector("tenant", np.vstack([self.window] * 2))[0], detector)
+
+    def test_stale_detector_refits(self):
+        with patch("recommendation_engine.time.monotonic", return_value=1000.0):
+            detector, _ = self.engine._get_detector("tenant", self.window)
+        with patch("recommendation_engine.time.monotonic", return_value=1000.0 + ANOMALY_MODEL_MAX_AGE_SECONDS):
+            self.assertIs(self.engine._get_detector("tenant", self.window)[0], detector)
+        with patch("recommendation_engine.time.monotonic", return_value=1001.0 + ANOMALY_MODEL_MAX_AGE_SECONDS):
+            self.assertIsNot(self.engine._get_detector("tenant", self.window)[0], detector)
+
+
+if __name__ == "__main__":
+    unittest.main()
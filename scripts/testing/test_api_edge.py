@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for the BI API edge middleware
+
+Covers the host allow-list, CORS preflight handling, bearer authentication and the
+token-bucket rate limit in EdgeMiddleware, driven through Starlette's TestClient.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+# Add the bi-engine directory to the path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "bi-engine"))
+
+from api_server import EdgeMiddleware
+
+
+def _build_app() -> FastAPI:
+    """Minimal app with one protected route and the default exempt paths"""
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        return {"status": "running"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/api/v1/profiles")
+    async def profiles(request: Request):
+        return {"user_id": request.scope.get("state", {}).get("user_id")}
+
+    return app
+
+
+def _client(**options) -> TestClient:
+    return TestClient(EdgeMiddleware(_build_app(), **options))
+
+
+def _client_from(peer: str, **options) -> TestClient:
+    """TestClient whose requests arrive from the given peer address"""
+    middleware = EdgeMiddleware(_build_app(), **options)
+
+    async def app(scope, receive, send):
+        await middleware(dict(scope, client=(peer, 40000)), receive, send)
+
+    return TestClient(app)
+
+
+class TestTrustedHost(unittest.TestCase):
+    """Host header allow-listing"""
+
+    def setUp(self):
+        self.client = _client(allowed_hosts=["api.bhashini.example"])
+
+    def test_allowed_host(self):
+        response = self.client.get("/health", headers={"host": "api.bhashini.example:8001"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_denied_host(self):
+        response = self.client.get("/health", headers={"host": "evil.example"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"detail": "Invalid host header"})
+
+    def test_any_host_without_allow_list(self):
+        response = _client().get("/health", headers={"host": "anything.example"})
+        self.assertEqual(response.status_code, 200)
+
+
+class TestCORS(unittest.TestCase):
+    """CORS preflight and response headers"""
+
+    PREFLIGHT_HEADERS = {
+        "origin": "https://dashboard.example",
+        "access-control-request-method": "GET",
+    }
+
+    def test_preflight_with_configured_origin(self):
+        client = _client(allowed_origins=["https://dashboard.example"])
+        response = client.options("/api/v1/profiles", headers=self.PREFLIGHT_HEADERS)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["access-control-allow-origin"], "https://dashboard.example")
+        self.assertIn("GET", response.headers["access-control-allow-methods"])
+        self.assertEqual(response.content, b"")
+
+    def test_preflight_without_configured_origins(self):
+        response = _client().options("/api/v1/profiles", headers=self.PREFLIGHT_HEADERS)
+        # Not answered by the middleware, so the route's 405 comes through without CORS headers
+        self.assertEqual(response.status_code, 405)
+        self.assertNotIn("access-control-allow-origin", response.headers)
+
+    def test_preflight_from_unlisted_origin(self):
+        client = _client(allowed_origins=["https://dashboard.example"])
+        response = client.options("/api/v1/profiles",
+                                  headers={**self.PREFLIGHT_HEADERS, "origin": "https://other.example"})
+        self.assertNotIn("access-control-allow-origin", response.headers)
+
+    def test_simple_request_gets_cors_headers(self):
+        client = _client(allowed_origins=["https://dashboard.example"])
+        response = client.get("/health", headers={"origin": "https://dashboard.example"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["access-control-allow-origin"], "https://dashboard.example")
+
+
+class TestBearerAuth(unittest.TestCase):
+    """Bearer token authentication"""
+
+    def setUp(self):
+        self.client = _client(require_auth=True, api_tokens=["token-one", "token-two"])
+
+    def test_missing_token_rejected(self):
+        response = self.client.get("/api/v1/profiles")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.headers["www-authenticate"], "Bearer")
+
+    def test_unknown_token_rejected(self):
+        response = self.client.get("/api/v1/profiles", headers={"authorization": "Bearer not-a-token"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_valid_token_accepted(self):
+        for token in ("token-one", "token-two"):
+            response = self.client.get("/api/v1/profiles", headers={"authorization": f"Bearer {token}"})
+            self.assertEqual(response.status_code, 200)
+            user_id = response.json()["user_id"]
+            self.assertTrue(user_id.startswith("user_"))
+            self.assertNotIn(token[:8], user_id)
+
+    def test_exempt_paths_skip_auth(self):
+        for path in ("/", "/health"):
+            self.assertEqual(self.client.get(path).status_code, 200)
+
+    def test_auth_optional_by_default(self):
+        self.assertEqual(_client().get("/api/v1/profiles").status_code, 200)
+
+    def test_require_auth_without_tokens_fails(self):
+        with self.assertRaises(ValueError):
+            EdgeMiddleware(_build_app(), require_auth=True)
+
+
+class TestRateLimit(unittest.TestCase):
+    """Token-bucket rate limiting"""
+
+    # A refill rate this low keeps the bucket from recovering during the test
+    OPTIONS = {"rate": 1e-6, "capacity": 3}
+
+    def test_429_after_burst(self):
+        client = _client(**self.OPTIONS)
+        statuses = [client.get("/api/v1/profiles").status_code for _ in range(4)]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+        self.assertEqual(client.get("/api/v1/profiles").headers["retry-after"], "60")
+
+    def test_exempt_paths_not_limited(self):
+        client = _client(**self.OPTIONS)
+        statuses = {client.get("/health").status_code for _ in range(10)}
+        self.assertEqual(statuses, {200})
+
+    def test_disabled_by_default(self):
+        client = _client()
+        statuses = {client.get("/api/v1/profiles").status_code for _ in range(10)}
+        self.assertEqual(statuses, {200})
+
+    def test_forwarded_clients_from_trusted_proxy_get_own_buckets(self):
+        client = _client_from("10.0.0.2", trusted_proxies=["10.0.0.0/8"], **self.OPTIONS)
+        for address in ("203.0.113.1", "203.0.113.2"):
+            headers = {"x-forwarded-for": address}
+            statuses = [client.get("/api/v1/profiles", headers=headers).status_code for _ in range(4)]
+            self.assertEqual(statuses, [200, 200, 200, 429])
+
+    def test_spoofed_forwarded_entries_ignored(self):
+        client = _client_from("10.0.0.2", trusted_proxies=["10.0.0.0/8"], **self.OPTIONS)
+        # The proxy appends the real peer; whatever the client prepended is not trusted
+        statuses = [
+            client.get("/api/v1/profiles", headers={"x-forwarded-for": f"198.51.100.{i}, 203.0.113.9"}).status_code
+            for i in range(4)
+        ]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+
+    def test_forwarded_header_ignored_from_untrusted_peer(self):
+        client = _client_from("203.0.113.50", trusted_proxies=["10.0.0.0/8"], **self.OPTIONS)
+        statuses = [
+            client.get("/api/v1/profiles", headers={"x-forwarded-for": f"198.51.100.{i}"}).status_code
+            for i in range(4)
+        ]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+
+
+if __name__ == "__main__":
+    unittest.main()
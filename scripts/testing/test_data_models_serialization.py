@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated model serializers in data_models
+
+Each mapped model's to_dict and the DataTransformer API builders are generated from the
+table columns at import. These tests check the generated code against straightforward
+column-by-column reference implementations, for rows read back from a database so that
+DateTime and JSON columns hold real driver-converted values.
+"""
+
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add the bi-engine directory to the path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "bi-engine"))
+
+from sqlalchemy import DateTime, JSON
+
+from data_models import (
+    CustomerProfile, DatabaseManager, DataTransformer, PROFILE_RESPONSE_FIELDS,
+    RECOMMENDATION_RESPONSE_FIELDS, Recommendation, ValueEstimate,
+)
+
+
+def _reference_to_dict(row):
+    """Reference output: every column value as-is, in column order"""
+    return {column.key: getattr(row, column.key) for column in row.__table__.columns}
+
+
+def _reference_api_response(row, fields):
+    """Reference output: the listed fields, with datetimes as ISO strings (None stays None)"""
+    return {
+        field: value.isoformat() if isinstance(value, datetime) else value
+        for field, value in ((field, getattr(row, field)) for field in fields)
+    }
+
+
+class TestGeneratedSerializers(unittest.TestCase):
+    """Generated to_dict / API converters against reference implementations"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = DatabaseManager("sqlite://")
+        with cls.db.session_scope() as session:
+            session.add(CustomerProfile(
+                tenant_id="gov_001",
+                organization_name="Digital Services Ministry",
+                sector="government",
+                use_case_category="citizen_services",
+                specific_use_cases=["portal", "helpdesk"],
+                target_user_base=50000,
+                geographical_coverage=["Delhi"],
+                languages_required=["Hindi", "English"],
+                business_goals=[],
+                success_metrics=["satisfaction"],
+                sla_tier="premium",
+                profile_created_date=datetime(2024, 1, 2, 3, 4, 5, 678901),
+                contact_email="ops@example.gov.in",
+            ))
+            session.add(Recommendation(
+                recommendation_id="perf_gov_001_0",
+                tenant_id="gov_001",
+                recommendation_type="performance",
+                priority="high",
+                title="Optimize Service Latency",
+                description="Latency is above target",
+                expected_impact="high",
+                implementation_effort="medium",
+                technical_details={"target_latency": "1000ms", "nested": {"values": [1, 2.5, None]}},
+            ))
+            session.add(Recommendation(
+                recommendation_id="rel_gov_001_0",
+                tenant_id="gov_001",
+                recommendation_type="reliability",
+                priority="critical",
+                title="Reduce Error Rates",
+                description="Error rate is above target",
+                expected_impact="high",
+                implementation_effort="low",
+                implemented_date=datetime(2024, 2, 1, 12, 0),
+                technical_details=None,
+            ))
+            session.add(ValueEstimate(
+                tenant_id="gov_001",
+                cost_savings=1000.0,
+                user_reach_impact=200,
+                efficiency_gains=12.5,
+                quality_improvements=8.0,
+                total_value_score=70.0,
+                calculation_methodology="ai_powered",
+                sector_multiplier=1.5,
+                use_case_multiplier=1.2,
+                confidence_score=80.0,
+                roi_ratio=2.5,
+                payback_period_months=6.0,
+            ))
+
+    def setUp(self):
+        self.session = self.db.get_session()
+        self.addCleanup(self.session.close)
+
+    def test_models_have_datetime_and_json_columns(self):
+        # Guard that the rows below actually exercise both column kinds
+        for model in (CustomerProfile, Recommendation):
+            types = {type(column.type) for column in model.__table__.columns}
+            self.assertIn(DateTime, types)
+            self.assertIn(JSON, types)
+        self.assertEqual(CustomerProfile._DT_COLS, {"profile_created_date", "last_updated"})
+
+    def test_to_dict_matches_reference(self):
+        for model in (CustomerProfile, Recommendation, ValueEstimate):
+            for row in self.session.query(model):
+                with self.subTest(model=model.__name__):
+                    self.assertEqual(row.to_dict(), _reference_to_dict(row))
+                    self.assertEqual(list(row.to_dict()), [c.key for c in model.__table__.columns])
+
+    def test_to_dict_keeps_native_values(self):
+        profile = self.session.get(CustomerProfile, "gov_001")
+        data = profile.to_dict()
+        self.assertEqual(data["profile_created_date"], datetime(2024, 1, 2, 3, 4, 5, 678901))
+        self.assertIsInstance(data["last_updated"], datetime)
+        self.assertEqual(data["specific_use_cases"], ["portal", "helpdesk"])
+
+        recommendation = self.session.get(Recommendation, "perf_gov_001_0")
+        self.assertEqual(recommendation.to_dict()["technical_details"],
+                         {"target_latency": "1000ms", "nested": {"values": [1, 2.5, None]}})
+        self.assertIsNone(recommendation.to_dict()["implemented_date"])
+
+    def test_api_responses_match_reference(self):
+        profile = self.session.get(CustomerProfile, "gov_001")
+        self.assertEqual(DataTransformer.profile_to_api_response(profile),
+                         _reference_api_response(profile, PROFILE_RESPONSE_FIELDS))
+
+        for recommendation in self.session.query(Recommendation):
+            with self.subTest(recommendation=recommendation.recommendation_id):
+                self.assertEqual(DataTransformer.recommendation_to_api_response(recommendation),
+                                 _reference_api_response(recommendation, RECOMMENDATION_RESPONSE_FIELDS))
+
+        response = DataTransformer.profile_to_api_response(profile)
+        self.assertEqual(response["profile_created_date"], "2024-01-02T03:04:05.678901")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for conditional profile and sector analytics reads in the BI API
+
+Profile and sector analytics reads carry a weak ETag derived from the profiler's version
+counter, and If-None-Match is parsed as ``*`` or a list of (weak or strong) ETags.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add the bi-engine directory to the path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "bi-engine"))
+
+from api_server import API_PREFIX, etag_matches, router
+from customer_profiler import CustomerProfiler
+
+
+class TestETagMatching(unittest.TestCase):
+    """If-None-Match parsing"""
+
+    ETAG = 'W/"abc.3"'
+
+    def test_missing_header(self):
+        self.assertFalse(etag_matches(None, self.ETAG))
+
+    def test_exact_and_weak_comparison(self):
+        self.assertTrue(etag_matches('W/"abc.3"', self.ETAG))
+        self.assertTrue(etag_matches('"abc.3"', self.ETAG))
+        self.assertFalse(etag_matches('W/"abc.4"', self.ETAG))
+
+    def test_list_of_etags(self):
+        self.assertTrue(etag_matches('"x", W/"abc.3" ,"y"', self.ETAG))
+        self.assertFalse(etag_matches('"x", "y"', self.ETAG))
+
+    def test_wildcard(self):
+        self.assertTrue(etag_matches(" * ", self.ETAG))
+
+
+class TestConditionalProfileRead(unittest.TestCase):
+    """ETag / 304 handling on GET /profiles/{tenant_id} and /analytics/sector/{sector}"""
+
+    def setUp(self):
+        self.profiler = CustomerProfiler(tenant_config_path="/nonexistent/tenant-config.yml")
+        self.profiler.create_profile_from_form({
+            "tenant_id": "school",
+            "organization_name": "City Public School",
+            "sector": "education",
+            "use_case_category": "content_localization",
+            "target_user_base": 1000,
+            "contact_email": "school@example.com",
+            "sla_tier": "standard",
+        })
+        app = FastAPI()
+        app.include_router(router)
+        app.state.profiler = self.profiler
+        self.client = TestClient(app)
+        self.url = f"{API_PREFIX}/profiles/school"
+
+    def test_revalidation(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["etag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        for header in (etag, f'"other", {etag}', "*"):
+            with self.subTest(header=header):
+                revalidated = self.client.get(self.url, headers={"if-none-match": header})
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated.content, b"")
+                self.assertEqual(revalidated.headers["etag"], etag)
+
+    def test_update_changes_etag(self):
+        etag = self.client.get(self.url).headers["etag"]
+        self.profiler.update_profile("school", {"organization_name": "Riverside Academy"})
+
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+        self.assertEqual(response.json()["organization_name"], "Riverside Academy")
+
+    def test_missing_profile(self):
+        self.assertEqual(self.client.get(f"{API_PREFIX}/profiles/unknown", headers={"if-none-match": "*"}).status_code, 404)
+
+    def test_sector_analytics(self):
+        url = f"{API_PREFIX}/analytics/sector/education"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["cache-control"], "private, max-age=30")
+        self.assertEqual(response.json(), {
+            "sector": "education",
+            "profile_count": 1,
+            "total_target_users": 1000,
+            "sla_distribution": {"standard": 1},
+            "use_case_distribution": {"content_localization": 1},
+        })
+        self.assertEqual(self.client.get(url, headers={"if-none-match": response.headers["etag"]}).status_code, 304)
+
+        self.profiler.deactivate_profile("school")
+        response = self.client.get(url, headers={"if-none-match": response.headers["etag"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["profile_count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
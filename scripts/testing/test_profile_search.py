@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for customer profile search
+
+search_profiles matches every query word as a prefix of a profile token (a word of the
+organization name, or its sector / use case), backed by an inverted index that is kept
+up to date as profiles are created, updated and deactivated.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the bi-engine directory to the path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "bi-engine"))
+
+from customer_profiler import CustomerProfiler
+
+
+class TestProfileSearch(unittest.TestCase):
+    """Test cases for prefix search over customer profiles"""
+
+    def setUp(self):
+        """Start from an empty profiler with three known profiles"""
+        self.profiler = CustomerProfiler(tenant_config_path="/nonexistent/tenant-config.yml")
+        self.assertEqual(self.profiler.profiles, {})
+
+        self.hospital = self._create("city_hospital", "City Healthcare Hospital", "healthcare", "patient_communication")
+        self.ministry = self._create("ministry", "Ministry of Health Services", "government", "citizen_services")
+        self.school = self._create("school", "City Public School", "education", "content_localization")
+
+    def _create(self, tenant_id, name, sector, use_case):
+        return self.profiler.create_profile_from_form({
+            "tenant_id": tenant_id,
+            "organization_name": name,
+            "sector": sector,
+            "use_case_category": use_case,
+            "target_user_base": 1000,
+            "contact_email": f"{tenant_id}@example.com",
+            "sla_tier": "standard",
+        })
+
+    def _search(self, query):
+        return {profile.tenant_id for profile in self.profiler.search_profiles(query)}
+
+    def test_prefix_match(self):
+        self.assertEqual(self._search("hosp"), {"city_hospital"})
+        self.assertEqual(self._search("health"), {"city_hospital", "ministry"})
+        self.assertEqual(self._search("HEALTHCARE"), {"city_hospital"})
+
+    def test_sector_and_use_case_match(self):
+        self.assertEqual(self._search("gov"), {"ministry"})
+        self.assertEqual(self._search("content_loc"), {"school"})
+
+    def test_infix_does_not_match(self):
+        # Words match from their start only; "care" is inside "Healthcare", not a prefix of it
+        self.assertEqual(self._search("care"), set())
+        self.assertEqual(self._search("pital"), set())
+
+    def test_multi_word_intersection(self):
+        self.assertEqual(self._search("city"), {"city_hospital", "school"})
+        self.assertEqual(self._search("city hosp"), {"city_hospital"})
+        self.assertEqual(self._search("hosp city"), {"city_hospital"})
+        self.assertEqual(self._search("city ministry"), set())
+
+    def test_empty_query_returns_all_profiles(self):
+        everyone = {"city_hospital", "ministry", "school"}
+        self.assertEqual(self._search(""), everyone)
+        self.assertEqual(self._search("   "), everyone)
+        self.assertEqual(self._search("!?"), everyone)
+
+    def test_index_follows_update_profile(self):
+        self.profiler.update_profile("school", {"organization_name": "Riverside Academy", "sector": "private"})
+
+        self.assertEqual(self._search("river"), {"school"})
+        self.assertEqual(self._search("priv"), {"school"})
+        self.assertEqual(self._search("city"), {"city_hospital"})
+        self.assertEqual(self._search("educ"), set())
+        self.assertNotIn("public", self.profiler._token_index)
+        self.assertNotIn("education", self.profiler._sorted_tokens)
+
+    def test_index_follows_deactivate_profile(self):
+        self.assertTrue(self.profiler.deactivate_profile("city_hospital"))
+
+        # Deactivated profiles stay searchable, with their tokens indexed exactly once
+        self.assertEqual(self._search("hosp"), {"city_hospital"})
+        self.assertEqual(self.profiler._sorted_tokens, sorted(set(self.profiler._sorted_tokens)))
+        self.assertEqual(self.profiler._token_index["hospital"], {"city_hospital"})
+
+    def test_results_in_profile_order(self):
+        self._create("city_clinic", "City Clinic", "healthcare", "patient_communication")
+        expected = {
+            "city": ["city_hospital", "school", "city_clinic"],
+            "health": ["city_hospital", "ministry", "city_clinic"],
+            "c": ["city_hospital", "ministry", "school", "city_clinic"],
+        }
+        for query, tenant_ids in expected.items():
+            with self.subTest(query=query):
+                self.assertEqual([profile.tenant_id for profile in self.profiler.search_profiles(query)], tenant_ids)
+
+    def test_sorted_tokens_match_index(self):
+        self.profiler.update_profile("ministry", {"organization_name": "Ministry of Finance"})
+        self.profiler.deactivate_profile("school")
+        self.assertEqual(self.profiler._sorted_tokens, sorted(self.profiler._token_index))
+
+
+if __name__ == "__main__":
+    unittest.main()